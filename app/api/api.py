@@ -1,7 +1,11 @@
 from fastapi import APIRouter
 
 from app.domains.infrastructure.router import router as infrastructure_router
+from app.domains.monitoring.router import router as monitoring_router
+from app.domains.ordering.router import router as ordering_router
 
 api_router = APIRouter()
 
 api_router.include_router(infrastructure_router)
+api_router.include_router(monitoring_router)
+api_router.include_router(ordering_router)
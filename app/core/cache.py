@@ -0,0 +1,149 @@
+"""In-process result cache with TTL, LRU eviction and tag based invalidation."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Protocol, TypeVar
+
+from app.core.singleflight import SingleFlight
+
+T = TypeVar("T")
+
+
+class ResultCache(Protocol):
+    """Interface the services cache through, any backend implementing it can be plugged in."""
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        tags: Iterable[str] = (),
+        ttl_of: Callable[[T], float] | None = None,
+    ) -> T: ...
+
+    def invalidate_tag(self, tag: str) -> int: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+class TTLCache:
+    """
+    Size bounded LRU cache with TTL, safe to use from a single event loop.
+
+    Entries can carry tags (e.g. fiscal week) and all entries of a tag can be invalidated at once.
+    Concurrent misses of the same key share one loader call, so an expired hot key doesn't send a burst of identical queries to the DB.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        Args:
+            max_entries (int): Entries kept before the least recently used one is evicted, 0 disables storing (loads are still shared).
+            ttl_seconds (float): Seconds an entry is served before it is loaded again.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any, tuple[str, ...]]] = OrderedDict()  # key: (expires_at, value, tags)
+        self._tags: dict[str, set[Hashable]] = {}
+        self._flight = SingleFlight()  # Shares loads of concurrent misses
+        self._generation = 0  # Bumped on invalidation, loads started before it are not stored
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        tags: Iterable[str] = (),
+        ttl_of: Callable[[T], float] | None = None,
+    ) -> T:
+        """
+        Return cached value of key, or load it with loader() and cache it.
+
+        Args:
+            key (Hashable): Normalized cache key.
+            loader (Callable): Coroutine function producing the value on a miss.
+            tags (Iterable[str]): Tags to invalidate the entry by.
+            ttl_of (Callable, optional): Seconds the loaded value may be served (e.g. until a token expires), capped at
+                ttl_seconds. Values with 0 or less are not stored. Defaults to ttl_seconds for every value.
+
+        Returns:
+            Cached or freshly loaded value.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._remove(key)
+
+        self.misses += 1
+
+        async def load():
+            generation = self._generation
+            value = await loader()
+            ttl = self.ttl_seconds if ttl_of is None else min(ttl_of(value), self.ttl_seconds)
+            if generation == self._generation and ttl > 0:
+                self._store(key, value, tuple(tags), ttl)
+            return value
+
+        return await self._flight.do(key, load)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """
+        Drop all entries with the given tag.
+
+        Returns:
+            int: Number of dropped entries.
+        """
+        self._generation += 1
+        keys = self._tags.pop(tag, set())
+        for key in keys:
+            self._remove(key)
+
+        return len(keys)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._tags.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self._flight.coalesced,
+            "evictions": self.evictions,
+        }
+
+    def _store(self, key: Hashable, value: Any, tags: tuple[str, ...], ttl: float):
+        if self.max_entries <= 0:
+            return
+
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
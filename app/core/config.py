@@ -1,16 +1,23 @@
+import functools
 import logging
-import tomllib
 from pathlib import Path
+from typing import Literal
 
-from pydantic import computed_field
+from pydantic import Field, computed_field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
 
 PROJECT_DIR = Path(__file__).parent.parent.parent
 PROJECT_TOML_PATH = PROJECT_DIR / "pyproject.toml"
 
-with open(PROJECT_TOML_PATH, "rb") as f:
-    PYPROJECT_CONTENT = tomllib.load(f)["project"]
+
+@functools.cache
+def project_metadata() -> dict:
+    """[project] table of pyproject.toml, parsed on first use instead of on import."""
+    import tomllib  # Only needed here, not loaded by imports which never read the metadata
+
+    with open(PROJECT_TOML_PATH, "rb") as f:
+        return tomllib.load(f)["project"]
 
 
 class Settings(BaseSettings):
@@ -29,10 +36,28 @@ class Settings(BaseSettings):
 
     # Logging, change to INFO in PROD
     log_level: int = logging.DEBUG
+    log_caller_info: bool = True  # File/Module/Function/Line in log lines, False skips stack inspection of intercepted stdlib records
+
+    # Defaults are read from pyproject.toml when Settings is built (not on import), APP_NAME etc. override them
+    app_name: str = Field(default_factory=lambda: project_metadata()["name"])
+    app_version: str = Field(default_factory=lambda: project_metadata()["version"])
+    app_description: str = Field(default_factory=lambda: project_metadata()["description"])
 
-    app_name: str = PYPROJECT_CONTENT["name"]
-    app_version: str = PYPROJECT_CONTENT["version"]
-    app_description: str = PYPROJECT_CONTENT["description"]
+    # Access log written by LoggingMiddleware
+    #     ^ text = request line and response line for every request
+    #     ^ json = single JSON record per request once it completes, successful requests can be sampled
+    access_log_mode: Literal["text", "json"] = "text"
+    access_log_sample_rate: float = Field(default=1.0, ge=0, le=1)  # Share of fast non-error requests logged in json mode
+    access_log_slow_ms: float = 1000  # Requests slower than this are logged as WARNING, always logged in json mode
+
+    # Production server with several worker processes, see app/server.py
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int = 0  # Worker processes, 0 = one per CPU core available to the process
+    server_graceful_timeout: int = 30  # Seconds a worker finishes in-flight requests on shutdown or reload before closing them
+    server_ready_timeout: float = 60  # Seconds a replacement worker gets on reload to import the app and complete its lifespan startup
+    server_keep_alive_timeout: int = 5  # Seconds an idle keep-alive connection is kept open
+    server_backlog: int = 2048  # Connections queued by the kernel while all workers are busy or restarting
 
     # Variables for the database
     postgres_host: str
@@ -42,6 +67,45 @@ class Settings(BaseSettings):
     postgres_db: str
     postgres_db_schema: str
 
+    # Connection pool, see sqlalchemy QueuePool
+    db_pool_size: int = 5  # Connections kept open in the pool
+    db_max_overflow: int = 10  # Extra connections opened above db_pool_size under load, closed when returned
+    db_pool_timeout: float = 30  # Seconds to wait for a free connection before raising TimeoutError
+    db_pool_recycle: int = -1  # Replace connections older than n seconds, -1 = never
+
+    # How pooled connections are checked for liveness
+    #     ^ pre_ping = SELECT 1 round trip on every checkout, safest but costs a round trip per request
+    #     ^ recycle = no check, relies on db_pool_recycle to replace connections before server/firewall drops them, needs db_pool_recycle > 0
+    #     ^ background = no check on checkout, background task pings DB every db_health_check_interval seconds and resets the pool on failure
+    db_liveness: Literal["pre_ping", "recycle", "background"] = "pre_ping"
+    db_health_check_interval: float = 30
+
+    # asyncpg statement caches (per connection), set both to 0 behind pgbouncer in transaction mode
+    db_statement_cache_size: int = 100  # asyncpg LRU of server-side prepared statements
+    db_prepared_statement_cache_size: int = 100  # SQLAlchemy asyncpg dialect LRU of prepared statement handles
+
+    # In-process cache of infrastructure query results
+    cache_max_entries: int = 1024  # Least recently used entries are evicted above this, 0 disables caching
+    cache_ttl_seconds: float = 300  # Seconds a cached result is served before it is queried again
+
+    # POST /infrastructure/vms/batch
+    batch_max_items: int = 100  # Sub-requests accepted in one batch
+    batch_max_concurrency: int = 4  # Sub-requests of one batch querying at once, keep it below db_pool_size so one batch can't drain the pool
+
+    # Cost rollups of v_infra_vms, see app/domains/infrastructure/rollups.py
+    rollup_max_age_seconds: float = 3600  # Cost aggregates are read from rollups refreshed within this, otherwise from v_infra_vms
+    rollup_state_ttl_seconds: float = 30  # Seconds each worker caches the rollup state before reading it again
+    rollup_refresh_interval: float = 0  # Seconds between background incremental refreshes, 0 = only POST /infrastructure/rollups/refresh
+
+    # Bearer token authorization, see app/core/security.py
+    auth_introspection_url: str | None = None  # OAuth2 token introspection endpoint (RFC 7662) of the identity provider
+    auth_introspection_client_id: str | None = None  # Client credentials the introspection endpoint is called with (HTTP Basic)
+    auth_introspection_client_secret: str | None = None
+    auth_introspection_timeout: float = 5
+    auth_roles_claim: str = "roles"  # Claim of the introspection response listing the roles, list or space separated string
+    auth_cache_max_entries: int = 10_000  # Tokens whose roles are cached per worker
+    auth_cache_ttl_seconds: float = 300  # Seconds roles of a token are cached at most, entries also expire with their token
+
     @computed_field
     @property
     def db_url(self) -> str:
@@ -59,5 +123,29 @@ class Settings(BaseSettings):
 
         return URL.human_repr(url)
 
+    @model_validator(mode="after")
+    def check_liveness(self):
+        if self.db_liveness == "recycle" and self.db_pool_recycle <= 0:
+            raise ValueError("db_liveness = recycle needs db_pool_recycle > 0, otherwise connections are never checked or replaced")
+        return self
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """Settings of this process, read from env vars and .env file on first use."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """
+    Module attribute `settings` is created on first access, importing the module reads no env and no files.
+
+    `from app.core.config import settings` is such an access. Core modules (database, logger, middleware) call
+    get_settings() inside their functions, so importing them doesn't build Settings either. Domain modules size their
+    caches and request limits from settings at import time and build it when they are imported, so does app.main for the
+    title and version of the FastAPI app (pyproject.toml is read then).
+    """
+    if name == "settings":
+        return get_settings()
 
-settings = Settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,230 @@
+import asyncio
+import time
 from typing import AsyncGenerator
 
 from pydantic import ConfigDict
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from app.core.config import settings
+from app.core.config import get_settings
+from app.core.logger import logger
+from app.utils import formatter
 
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
 
-# Create async database engine
-engine = create_async_engine(
-    settings.db_url,
-    pool_pre_ping=True,  # Validates DB connections before use
-)
+# ============================================
+# POOL METRICS
+# ============================================
+
+
+class PoolMetrics:
+    """Cumulative checkout statistics of the connection pool."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.checkins = 0
+        self.hold_time_total = 0.0
+        self.hold_time_max = 0.0
+
+    def record_wait(self, wait_time: float, timed_out: bool = False):
+        self.checkouts += 1
+        self.timeouts += timed_out
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def record_hold(self, hold_time: float):
+        self.checkins += 1
+        self.hold_time_total += hold_time
+        self.hold_time_max = max(self.hold_time_max, hold_time)
+
+    def snapshot(self) -> dict:
+        """Checkout wait and hold times in milliseconds."""
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_time_avg_ms": self.wait_time_total / self.checkouts * 1000 if self.checkouts else 0.0,
+            "wait_time_max_ms": self.wait_time_max * 1000,
+            "hold_time_avg_ms": self.hold_time_total / self.checkins * 1000 if self.checkins else 0.0,
+            "hold_time_max_ms": self.hold_time_max * 1000,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool which records how long each checkout waits for a connection and how long the connection is held.
+
+    Hold time runs from checkout to checkin. A connection held while a response is serialized is idle, but no other request
+    can use it, so hold time much larger than query time means connections are released too late.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            record = super()._do_get()
+            record.info["checked_out_at"] = time.perf_counter()
+            return record
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out)
+
+    def _do_return_conn(self, record):
+        checked_out_at = record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            pool_metrics.record_hold(time.perf_counter() - checked_out_at)
+        super()._do_return_conn(record)
+
+
+def pool_status() -> dict:
+    """
+    Current state of the engine's connection pool.
+
+    Returns:
+        dict: Pool size, checked out/in and overflow connections, and cumulative checkout wait and hold times.
+            Connection counts are 0 before init_engine().
+    """
+    if engine is None:
+        return {"size": 0, "checked_out": 0, "checked_in": 0, "overflow": 0, **pool_metrics.snapshot()}
+
+    pool = engine.pool
+
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool_metrics.snapshot(),
+    }
+
+
+# ============================================
+# ENGINE
+# ============================================
+
+# Engine of this process, created by init_engine() in app.main.lifespan and disposed by dispose_engine() on shutdown.
+# Importing the app neither loads the DB driver nor creates a pool, so processes forked after import don't share connections
+engine: AsyncEngine | None = None
+
+# Same pool as engine, connections are switched to autocommit while checked out by a read session.
+# Every SELECT is its own implicit transaction, so reads cost no BEGIN and no COMMIT/ROLLBACK round trips
+read_engine: AsyncEngine | None = None
+
+
+def build_engine() -> AsyncEngine:
+    """Create async database engine from settings, no connection is opened until the first checkout."""
+    settings = get_settings()
+
+    return create_async_engine(
+        settings.db_url,
+        poolclass=MeteredQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_liveness == "pre_ping",  # Validates DB connections before use
+        connect_args={
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
+    )
+
+
+def init_engine() -> AsyncEngine:
+    """
+    Create the engine of this process and bind the session factories to it, once per process.
+
+    Returns:
+        AsyncEngine: Engine of this process.
+    """
+    global engine, read_engine
+
+    if engine is None:
+        engine = build_engine()
+        read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+        async_session_factory.configure(bind=engine)
+        read_session_factory.configure(bind=read_engine)
+
+    return engine
+
 
+async def dispose_engine():
+    """Close all pooled connections and unbind the session factories, init_engine() creates a new engine afterwards."""
+    global engine, read_engine
+
+    if engine is None:
+        return
+
+    await engine.dispose()
+    engine = read_engine = None
+    async_session_factory.configure(bind=None)
+    read_session_factory.configure(bind=None)
+
+
+# Session factories are bound to the engine by init_engine()
 async_session_factory = async_sessionmaker(
-    bind=engine,
     class_=AsyncSession,  # Class to use in order to create new Session objects
 )
 
 
+class ReadSession(AsyncSession):
+    """
+    Session of read-only endpoints, see get_read_session().
+
+    Results of AsyncSession.execute() are fully buffered, so the connection goes back to the pool right after each query
+    instead of when the session is closed after the response is serialized. The next query checks out a connection again.
+    Streaming (server-side cursors) needs a transaction and is not supported.
+    """
+
+    async def execute(self, *args, **kwargs):
+        try:
+            return await super().execute(*args, **kwargs)
+        finally:
+            await self.close()
+
+
+# Sessions of read-only endpoints. Reads never change mapped objects, so there is nothing to autoflush before a query
+# and nothing to expire after the transaction
+read_session_factory = async_sessionmaker(
+    class_=ReadSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def is_autocommit(db_session: AsyncSession) -> bool:
+    """Whether queries of the session run outside of a transaction, e.g. sessions of get_read_session()."""
+    return db_session.bind.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Session factory for endpoints which run several queries concurrently, an AsyncSession can't be shared between tasks.
+    Dependency, so it can be overridden like get_session.
+    """
+    return async_session_factory
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Create async session.
@@ -37,3 +239,55 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Read-only counterpart of get_session_factory(), see get_read_session()."""
+    return read_session_factory
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create async session for endpoints which only read.
+
+    Queries run in autocommit mode and the connection is released after every query, see ReadSession.
+    Unlike get_session(), nothing is committed or rolled back, no round trips besides the queries themselves.
+    """
+    async with read_session_factory() as session:
+        yield session
+
+
+# ============================================
+# BACKGROUND HEALTH CHECK
+# ============================================
+
+
+async def health_check_loop():
+    """
+    Ping the database every db_health_check_interval seconds, used when db_liveness = "background".
+
+    Replaces the per-checkout pre-ping with one round trip per interval. When the ping fails, the pool is disposed, so
+    stale connections are dropped and the following checkouts open fresh ones.
+    """
+    interval = get_settings().db_health_check_interval
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.warning(formatter.format_error(e, "Database health check failed, resetting connection pool"))
+            await engine.dispose()
+
+
+def start_health_check() -> asyncio.Task | None:
+    """
+    Start health_check_loop() when db_liveness = "background".
+
+    Returns:
+        asyncio.Task | None: Task to cancel on shutdown, None when other liveness strategy is configured.
+    """
+    if get_settings().db_liveness != "background":
+        return None
+
+    return asyncio.create_task(health_check_loop(), name="db-health-check")
@@ -1,25 +1,85 @@
 """Configuration of loguru."""
 
+import functools
+import inspect
+import itertools
 import logging
+import os
+import secrets
 import sys
-import uuid
 from contextvars import ContextVar
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 
-from .config import settings
+from .config import get_settings
 
 BASE_DIR = Path(__file__).parent
 LOG_PATH = BASE_DIR / "logs" / "app.log"  # Store logs here
 
+# Format: Timestamp | Level | RequestID | Source | Message
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<yellow>ReqID:{extra[request_id]}</yellow> | "
+    "<cyan>File[{file}] Module[{name}] Function[{function}] Line[{line}]</cyan> | "
+    "<level>{message}</level>"
+)
+
+# Same format without the source, used when settings.log_caller_info is False
+LOG_FORMAT_NO_CALLER = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<yellow>ReqID:{extra[request_id]}</yellow> | "
+    "<level>{message}</level>"
+)
+
 
 # ============================================
 # CONTEXT VARIABLES FOR REQUEST TRACKING
 # ============================================
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
+# Request ID of logs emitted outside of a request (startup, shutdown, background tasks)
+NO_REQUEST_ID = "-"
+
+
+# ============================================
+# REQUEST ID GENERATION
+# ============================================
+
+
+def _new_request_id_prefix() -> str:
+    """PID of the process (unique among running workers of a host) and 32 random bits (unique across hosts and reloads)."""
+    return f"{os.getpid():x}-{secrets.token_hex(4)}"
+
+
+# Per process prefix + counter, unique across workers without paying for uuid4() on every request
+_request_id_prefix = _new_request_id_prefix()
+_request_id_counter = itertools.count(1)
+
+
+def _reset_request_id_generator():
+    """Give forked worker processes their own prefix, otherwise they would hand out the parent's IDs."""
+    global _request_id_prefix, _request_id_counter
+
+    _request_id_prefix = _new_request_id_prefix()
+    _request_id_counter = itertools.count(1)
+
+
+os.register_at_fork(after_in_child=_reset_request_id_generator)
+
+
+def new_request_id() -> str:
+    """
+    Generate request ID for tracing.
+
+    Returns:
+        str: Process prefix and request counter in hex, e.g. "3fa2-9c2e41b0-1b".
+    """
+    return f"{_request_id_prefix}-{next(_request_id_counter):x}"
+
 
 # ============================================
 # CUSTOM FILTER FOR CORRELATION
@@ -30,6 +90,9 @@ def correlation_filter(record: "Record") -> bool:
     """
     Add Request ID to log record.
 
+    Inside a request, request_id is already bound to the record by LoggingMiddleware (logger.contextualize), so this only
+    fills in request_id_var or NO_REQUEST_ID for records logged outside of it.
+
     Args:
         record (Record): Log record from Loguru (contains everything about log line - message, level, time etc.)
 
@@ -37,8 +100,10 @@ def correlation_filter(record: "Record") -> bool:
         bool: True to include the log, False to filter it out.
     """
 
-    # Get request_id. If it doesn't exist, create one. Attach to record
-    record["extra"]["request_id"] = request_id_var.get() or str(uuid.uuid4())[:8]
+    # Get request_id if it isn't bound yet. Attach to record
+    extra = record["extra"]
+    if "request_id" not in extra:
+        extra["request_id"] = request_id_var.get() or NO_REQUEST_ID
 
     return True
 
@@ -48,12 +113,36 @@ def correlation_filter(record: "Record") -> bool:
 # ============================================
 
 
+@functools.lru_cache(maxsize=64)
+def loguru_level(levelname: str, levelno: int) -> str | int:
+    """
+    Map standard logging level to Loguru level, cached as there are only a handful of them.
+
+    Returns:
+        str | int: Name of the Loguru level if it exists, otherwise the level number.
+    """
+    try:
+        return logger.level(levelname).name
+    except ValueError:
+        return levelno
+
+
 class InterceptHandler(logging.Handler):
     """
     Intercepts standard logging and redirects to Loguru.
     Used to replace Uvicorn's default loggers with our Loguru configuration.
     """
 
+    def __init__(self, level: int = logging.NOTSET, caller_info: bool = True):
+        """
+        Args:
+            level (int, optional): Minimal level of handled records. Defaults to logging.NOTSET.
+            caller_info (bool, optional): Walk the stack to attribute the record to the original caller, only needed when
+                the log format shows file/function/line. Defaults to True.
+        """
+        super().__init__(level)
+        self.caller_info = caller_info
+
     def emit(self, record: logging.LogRecord):
         """
         Process a log record and redirect it to Loguru.
@@ -61,17 +150,15 @@ class InterceptHandler(logging.Handler):
         This method is called by the logging framework for each log record. We extract the log level and message, then pass it to Loguru.
         """
         # Get corresponding Loguru level if it exists
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        # Find the caller from where the logging call originated
-        frame = logging.currentframe()
-        depth = 2
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+        level = loguru_level(record.levelname, record.levelno)
+
+        # Find the caller from where the logging call originated, first frame outside of this method and the logging module
+        depth = 0
+        if self.caller_info:
+            frame = inspect.currentframe()
+            while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+                frame = frame.f_back
+                depth += 1
 
         # Log to Loguru with the appropriate level and context
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
@@ -89,20 +176,15 @@ def setup_logger():
     This should be called once during application startup, preferably in the FastAPI lifespan startup event.
     """
 
+    settings = get_settings()
+
     # Remove default handler to avoid duplicate logs
     logger.remove()
 
     # Get log level
     log_level = settings.log_level
 
-    # Format: Timestamp | Level | RequestID | Source | Message
-    log_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-        "<level>{level: <8}</level> | "
-        "<yellow>ReqID:{extra[request_id]}</yellow> | "
-        "<cyan>File[{file}] Module[{name}] Function[{function}] Line[{line}]</cyan> | "
-        "<level>{message}</level>"
-    )
+    log_format = LOG_FORMAT if settings.log_caller_info else LOG_FORMAT_NO_CALLER
 
     # Console output
     logger.add(
@@ -145,15 +227,23 @@ def configure_uvicorn_logging():
 
     import logging
 
-    # Intercept all loggers and set to lowest level
-    # Loguru will handle the actual filtering
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    settings = get_settings()
+    handler = InterceptHandler(caller_info=settings.log_caller_info)
+
+    # Intercept all loggers at the configured level, records below it are dropped by logger.isEnabledFor()
+    # before a LogRecord is even created instead of being built and thrown away by Loguru
+    logging.basicConfig(handlers=[handler], level=settings.log_level, force=True)
 
     # Update existing loggers, especially Uvicorn loggers
     for name in logging.root.manager.loggerDict.keys():
         if name.startswith("uvicorn"):
-            logging.getLogger(name).handlers = [InterceptHandler()]
+            logging.getLogger(name).handlers = [handler]
             logging.getLogger(name).propagate = False
+            logging.getLogger(name).setLevel(settings.log_level)
+
+    # JSON access log of LoggingMiddleware already records every request, uvicorn's access log line would be a duplicate
+    if settings.access_log_mode == "json":
+        logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
     logger.debug("Uvicorn logging configured to use Loguru.")
 
@@ -0,0 +1,143 @@
+"""
+Bearer token authorization.
+
+Roles of a token are resolved by the identity provider through OAuth2 token introspection (RFC 7662) and cached per worker
+until the token expires (at most settings.auth_cache_ttl_seconds). Concurrent checks of the same token share one
+introspection call, so a token reused across requests costs a dict lookup instead of a round trip to the provider.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import time
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Annotated, Awaitable, Callable
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+
+from app.core.cache import ResultCache, TTLCache
+from app.core.config import settings
+from app.core.logger import logger
+from app.utils import formatter
+
+
+class RoleNames(StrEnum):
+    ORDERING = "ordering"
+    INFRASTRUCTURE_ADMIN = "infrastructure_admin"
+
+
+@dataclass(frozen=True, slots=True)
+class TokenRoles:
+    """Authorization decision of a token."""
+
+    active: bool
+    roles: frozenset[str]
+    expires_at: float | None = None  # Unix time the token expires, None when the provider doesn't tell
+
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+
+# Decisions are cached by a hash of the token, tokens themselves are not kept in memory
+roles_cache: ResultCache = TTLCache(max_entries=settings.auth_cache_max_entries, ttl_seconds=settings.auth_cache_ttl_seconds)
+
+not_authenticated_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid or expired token",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+not_enough_privileges_exception = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="You don't have enough privileges to access this data.",
+)
+
+
+def parse_introspection(content: dict) -> TokenRoles:
+    """TokenRoles of an introspection response, roles are read from settings.auth_roles_claim."""
+    if not content.get("active"):
+        return TokenRoles(active=False, roles=frozenset())
+
+    roles = content.get(settings.auth_roles_claim) or []
+    if isinstance(roles, str):
+        roles = roles.split()
+
+    return TokenRoles(active=True, roles=frozenset(roles), expires_at=content.get("exp"))
+
+
+def post_introspection(token: str) -> dict:
+    """Blocking call of the introspection endpoint, run in a thread by introspect()."""
+    request = urllib.request.Request(
+        settings.auth_introspection_url,
+        data=urllib.parse.urlencode({"token": token, "token_type_hint": "access_token"}).encode(),
+        headers={"Content-Type": "application/x-www-form-urlencoded", "Accept": "application/json"},
+    )
+    if settings.auth_introspection_client_id is not None:
+        credentials = f"{settings.auth_introspection_client_id}:{settings.auth_introspection_client_secret or ''}"
+        request.add_header("Authorization", f"Basic {base64.b64encode(credentials.encode()).decode()}")
+
+    with urllib.request.urlopen(request, timeout=settings.auth_introspection_timeout) as response:
+        return json.load(response)
+
+
+async def introspect(token: str) -> TokenRoles:
+    """
+    Ask the identity provider for the roles of a token.
+
+    Raises:
+        HTTPException: 503 when the provider is not configured or can't be reached, the decision is not cached then.
+    """
+    if settings.auth_introspection_url is None:
+        logger.error("Token introspection URL is not configured, set AUTH_INTROSPECTION_URL")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Authorization is not available")
+
+    try:
+        content = await asyncio.to_thread(post_introspection, token)
+    except Exception as e:
+        logger.error(formatter.format_error(e, "Error calling token introspection endpoint"))
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Authorization is not available")
+
+    return parse_introspection(content)
+
+
+def seconds_valid(token_roles: TokenRoles) -> float:
+    """Seconds a decision may be cached, until the token expires. Inactive tokens are cached for the full cache TTL."""
+    if token_roles.expires_at is None:
+        return settings.auth_cache_ttl_seconds
+
+    return token_roles.expires_at - time.time()
+
+
+async def get_token_roles(token: str) -> TokenRoles:
+    """
+    Roles of a token, from roles_cache or introspect().
+
+    Returns:
+        TokenRoles: Whether the token is active and its roles.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+
+    return await roles_cache.get_or_load(key, lambda: introspect(token), ttl_of=seconds_valid)
+
+
+def require_role(role: str) -> Callable[..., Awaitable[None]]:
+    """
+    Dependency which lets requests through only with a bearer token holding the role.
+
+    Raises:
+        HTTPException: 401 when the token is missing, inactive or expired, 403 when the token lacks the role.
+    """
+
+    async def check_role(token: Annotated[str, Depends(oauth2_scheme)]):
+        token_roles = await get_token_roles(token)
+        # Cache entries expire with their token, exp is checked again for decisions shared with callers of an in-flight introspection
+        if not token_roles.active or (token_roles.expires_at is not None and token_roles.expires_at <= time.time()):
+            raise not_authenticated_exception
+        if role not in token_roles.roles:
+            raise not_enough_privileges_exception
+
+    return check_role
@@ -0,0 +1,71 @@
+"""Request coalescing, concurrent identical calls share one execution."""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key, safe to use from a single event loop.
+
+    First caller of a key runs the function, callers arriving while it is in flight await the same future instead of running it again.
+    Results are only shared while in flight, nothing is kept once the call finishes.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+        self.calls = 0  # Calls which executed the function
+        self.coalesced = 0  # Calls which received the result (or exception) of a call already in flight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() unless a call with the same key is already in flight, then await its result.
+
+        Args:
+            key (Hashable): Key identifying identical calls.
+            fn (Callable): Coroutine function to execute.
+
+        Returns:
+            Result of fn(), shared by all concurrent callers of the key.
+        """
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # This caller was cancelled, not the shared call
+                # Caller which started the call was cancelled. The first waiter to wake up runs it again, the others
+                # find its call in flight and await it
+            finally:
+                if inflight.done() and not inflight.cancelled():
+                    self.coalesced += 1  # Counted once, when the shared outcome is received
+
+        self.calls += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved, there might be no waiters
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        future.set_result(result)
+
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
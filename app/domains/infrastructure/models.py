@@ -1,7 +1,9 @@
 """SQL ORM Models for data pulls from db"""
 
-from sqlalchemy import PrimaryKeyConstraint
-from sqlalchemy.orm import Mapped
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 
@@ -18,3 +20,43 @@ class InfrastructureVMs(Base):
     fisc_yr: Mapped[str | None]
     cost: Mapped[float | None]
     role: Mapped[str | None]
+
+
+# ============================================
+# Rollups of v_infra_vms, created and maintained by rollups.refresh()
+#     ^ grouping columns can be NULL (e.g. role of a VM without cluster), so the key is only known to the ORM, not a DB constraint
+
+
+class InfrastructureCostWeekRole(Base):
+    __tablename__ = "infra_cost_wk_role"
+    __table_args__ = (Index("ix_infra_cost_wk_role_fisc_wk", "fisc_wk"),)
+    __mapper_args__ = {"primary_key": ["fisc_wk", "role"]}
+
+    fisc_wk: Mapped[str]
+    fisc_yr: Mapped[str | None]
+    role: Mapped[str | None]
+    vm_count: Mapped[int]  # Distinct VMs, additive over roles of a week as a VM has a single row per week
+    cost_count: Mapped[int]  # Rows with cost, divisor of the average
+    total_cost: Mapped[float]
+
+
+class InfrastructureCostYearVM(Base):
+    __tablename__ = "infra_cost_yr_vm"
+    __table_args__ = (Index("ix_infra_cost_yr_vm_fisc_yr", "fisc_yr", "vm_name"),)
+    __mapper_args__ = {"primary_key": ["fisc_yr", "vm_name", "role"]}
+
+    fisc_yr: Mapped[str | None]
+    vm_name: Mapped[str]
+    role: Mapped[str | None]  # Split by role only when the VM changed cluster role within the year
+    weeks: Mapped[int]  # Fiscal weeks the VM has a row in
+    cost_count: Mapped[int]
+    total_cost: Mapped[float]
+
+
+class InfrastructureRollupState(Base):
+    __tablename__ = "infra_rollup_state"
+
+    name: Mapped[str] = mapped_column(primary_key=True)
+    last_fisc_wk: Mapped[str | None]  # Latest fiscal week in the rollups, following refreshes start after it
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    duration_ms: Mapped[float]
@@ -0,0 +1,224 @@
+"""
+Cost rollups of v_infra_vms.
+
+v_infra_vms joins vms with clusters on every query, so aggregates over it cost O(rows). The rollup tables keep cost
+pre-aggregated, reports over them cost O(groups):
+    * infra_cost_wk_role - cost per (fisc_wk, role)
+    * infra_cost_yr_vm   - cost per (fisc_yr, vm_name), with role
+
+refresh() is incremental, only fiscal weeks newer than the last refresh are aggregated and only fiscal years of those weeks
+are recomputed. Reloaded weeks can be passed explicitly, full refresh rebuilds both tables.
+Services read from the rollups only while they are fresh, refreshed within settings.rollup_max_age_seconds and covering
+every fiscal week of v_infra_vms. A newly loaded week makes them stale until the next refresh, aggregates are read from
+v_infra_vms meanwhile. Reloaded weeks aren't detected, pass them to refresh().
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, Row, delete, distinct, exc, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import database
+from app.core.cache import ResultCache, TTLCache
+from app.core.config import settings
+from app.core.database import Base
+from app.core.logger import logger
+from app.domains.infrastructure import models
+from app.utils import formatter
+
+ROLLUP_NAME = "v_infra_vms"
+ROLLUP_LOCK_ID = 7_212_013  # pg_advisory_xact_lock key, serializes refreshes of all workers
+ROLLUP_TABLES = [
+    models.InfrastructureCostWeekRole.__table__,
+    models.InfrastructureCostYearVM.__table__,
+    models.InfrastructureRollupState.__table__,
+]
+
+# Freshness is checked before every aggregate query, each worker caches it instead of reading it every time
+state_cache: ResultCache = TTLCache(max_entries=1, ttl_seconds=settings.rollup_state_ttl_seconds)
+
+
+# ============================================
+# FRESHNESS
+# ============================================
+
+
+async def get_state(db_session: AsyncSession) -> Row | None:
+    """
+    Read the rollup state.
+
+    Returns:
+        Row | None: last_fisc_wk, refreshed_at and duration_ms of the last refresh, None when rollups were never refreshed.
+    """
+    state = models.InfrastructureRollupState
+    stmt = select(state.last_fisc_wk, state.refreshed_at, state.duration_ms).where(state.name == ROLLUP_NAME)
+
+    try:
+        if database.is_autocommit(db_session):
+            return (await db_session.execute(stmt)).first()
+
+        # Savepoint, so a missing state table doesn't abort the transaction of the request
+        async with db_session.begin_nested():
+            result = await db_session.execute(stmt)
+            return result.first()
+    except exc.DBAPIError as e:
+        logger.debug(formatter.format_error(e, "Rollup state not available, rollups were not refreshed yet"))
+        return None
+
+
+def age_seconds(state: Row) -> float:
+    """Seconds since the last refresh."""
+    refreshed_at = state.refreshed_at
+    if refreshed_at.tzinfo is None:  # Drivers without timezone support return naive UTC
+        refreshed_at = refreshed_at.replace(tzinfo=timezone.utc)
+
+    return (datetime.now(timezone.utc) - refreshed_at).total_seconds()
+
+
+async def source_last_fisc_wk(db_session: AsyncSession) -> str | None:
+    """Latest fiscal week in v_infra_vms."""
+    return (await db_session.execute(select(func.max(models.InfrastructureVMs.fisc_wk)))).scalar()
+
+
+def is_fresh(state: Row | None, last_source_wk: str | None) -> bool:
+    """Whether the rollups were refreshed within settings.rollup_max_age_seconds and cover the latest week of v_infra_vms."""
+    if state is None or age_seconds(state) > settings.rollup_max_age_seconds:
+        return False
+
+    return last_source_wk is None or (state.last_fisc_wk is not None and last_source_wk <= state.last_fisc_wk)
+
+
+async def load_fresh(db_session: AsyncSession) -> bool:
+    state = await get_state(db_session)
+    if state is None:
+        return False
+
+    return is_fresh(state, await source_last_fisc_wk(db_session))
+
+
+async def fresh(db_session: AsyncSession) -> bool:
+    """Whether aggregates can be read from the rollups, cached for settings.rollup_state_ttl_seconds."""
+    return await state_cache.get_or_load("fresh", lambda: load_fresh(db_session))
+
+
+# ============================================
+# REFRESH
+# ============================================
+
+
+def year_condition(column, years: Sequence[str | None]) -> ColumnElement[bool]:
+    """column IN years, NULL years included."""
+    condition = column.in_([year for year in years if year is not None])
+
+    return or_(condition, column.is_(None)) if None in years else condition
+
+
+async def refresh(db_session: AsyncSession, full: bool = False, fisc_wks: Sequence[str] = ()) -> dict:
+    """
+    Refresh the rollups and commit.
+
+    Without arguments, only fiscal weeks newer than the last refreshed one are aggregated. The first refresh is always a
+    full one and creates the rollup tables when missing. On Postgres, refreshes of all workers are serialized by an advisory
+    lock taken before anything else, so workers refreshing for the first time at once don't race on CREATE TABLE.
+
+    Args:
+        db_session (AsyncSession): Session to refresh in, committed on success.
+        full (bool, optional): Rebuild the rollups from scratch. Defaults to False.
+        fisc_wks (Sequence[str], optional): Reloaded fiscal weeks to aggregate again. Defaults to new weeks only.
+
+    Returns:
+        dict: Refreshed fiscal weeks (fisc_wk) and years (fisc_yr), whether it was a full refresh and duration_ms.
+    """
+    start = time.perf_counter()
+    vms = models.InfrastructureVMs
+    week_role = models.InfrastructureCostWeekRole
+    year_vm = models.InfrastructureCostYearVM
+
+    if db_session.bind.dialect.name == "postgresql":
+        await db_session.execute(select(func.pg_advisory_xact_lock(ROLLUP_LOCK_ID)))
+    # DDL runs in the locked transaction (Postgres DDL is transactional), tables exist after the first refresh
+    await db_session.run_sync(lambda session: Base.metadata.create_all(session.connection(), tables=ROLLUP_TABLES))
+
+    state = await db_session.get(models.InfrastructureRollupState, ROLLUP_NAME)
+    full = full or state is None
+
+    if full:
+        weeks = None
+    elif fisc_wks:
+        weeks = sorted(set(fisc_wks))
+    else:
+        stmt = select(distinct(vms.fisc_wk))
+        if state.last_fisc_wk is not None:
+            stmt = stmt.where(vms.fisc_wk > state.last_fisc_wk)
+        weeks = sorted((await db_session.execute(stmt)).scalars())
+
+    years: list[str | None] = []
+    if full or weeks:
+        # Years of the weeks before and after the refresh, a reloaded week may have moved or lost rows
+        if not full:
+            stmt = select(distinct(week_role.fisc_yr)).where(week_role.fisc_wk.in_(weeks))
+            years = list((await db_session.execute(stmt)).scalars())
+
+        # Cost per (fisc_wk, role) of the weeks
+        await db_session.execute(delete(week_role).where(week_role.fisc_wk.in_(weeks)) if weeks else delete(week_role))
+        await db_session.execute(
+            insert(week_role).from_select(
+                ["fisc_wk", "fisc_yr", "role", "vm_count", "cost_count", "total_cost"],
+                select(
+                    vms.fisc_wk,
+                    vms.fisc_yr,
+                    vms.role,
+                    func.count(distinct(vms.vm_name)),
+                    func.count(vms.cost),
+                    func.coalesce(func.sum(vms.cost), 0),
+                )
+                .where(*([vms.fisc_wk.in_(weeks)] if weeks else []))
+                .group_by(vms.fisc_wk, vms.fisc_yr, vms.role),
+            )
+        )
+
+        # Cost per (fisc_yr, vm_name) of the years the weeks belong to, v_infra_vms is read by fisc_wk of those years
+        year_filter = []
+        if weeks:
+            stmt = select(distinct(week_role.fisc_yr)).where(week_role.fisc_wk.in_(weeks))
+            years = sorted(set(years) | set((await db_session.execute(stmt)).scalars()), key=lambda year: year or "")
+            year_weeks = select(week_role.fisc_wk).where(year_condition(week_role.fisc_yr, years))
+            year_filter = [vms.fisc_wk.in_(year_weeks), year_condition(vms.fisc_yr, years)]
+
+        await db_session.execute(delete(year_vm).where(year_condition(year_vm.fisc_yr, years)) if weeks else delete(year_vm))
+        await db_session.execute(
+            insert(year_vm).from_select(
+                ["fisc_yr", "vm_name", "role", "weeks", "cost_count", "total_cost"],
+                select(
+                    vms.fisc_yr,
+                    vms.vm_name,
+                    vms.role,
+                    func.count(),
+                    func.count(vms.cost),
+                    func.coalesce(func.sum(vms.cost), 0),
+                )
+                .where(*year_filter)
+                .group_by(vms.fisc_yr, vms.vm_name, vms.role),
+            )
+        )
+
+        if full:
+            weeks = sorted((await db_session.execute(select(distinct(week_role.fisc_wk)))).scalars())
+            years = sorted((await db_session.execute(select(distinct(year_vm.fisc_yr)))).scalars(), key=lambda year: year or "")
+
+    last_fisc_wk = (await db_session.execute(select(func.max(week_role.fisc_wk)))).scalar()
+    if state is None:
+        state = models.InfrastructureRollupState(name=ROLLUP_NAME)
+        db_session.add(state)
+    state.last_fisc_wk = last_fisc_wk
+    state.refreshed_at = datetime.now(timezone.utc)
+    state.duration_ms = duration_ms = (time.perf_counter() - start) * 1000
+
+    await db_session.commit()
+    state_cache.clear()
+
+    logger.info(f"Rollups refreshed in {duration_ms:.0f}ms, full[{full}] weeks[{len(weeks)}] years[{len(years)}]")
+
+    return {"full": full, "fisc_wk": weeks, "fisc_yr": years, "duration_ms": duration_ms}
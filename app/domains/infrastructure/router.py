@@ -1,10 +1,12 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.database import get_session
-from app.domains.infrastructure import models, schemas, services
+from app.core.database import get_read_session, get_read_session_factory, get_session
+from app.core.security import RoleNames, require_role
+from app.domains.infrastructure import schemas, services
 
 router = APIRouter(prefix="/infrastructure", tags=["Infrastructure"])
 
@@ -13,8 +15,11 @@ router = APIRouter(prefix="/infrastructure", tags=["Infrastructure"])
 
 # ============================================
 # Two possibilities on how to approach the endpoints
-#     ^ get_all() calls service get_all() which returns an ORM object, and endpoint validates and serializes it with pydantic by using response_model = schema to validate on
-#     ^ get_vms()
+#     ^ get_all() calls service get_all() which returns DB rows, and endpoint validates and serializes it with pydantic by using response_model = schema to validate on
+#     ^ post_vms() calls service post_vms() which renders the JSON body in one pass, endpoint returns it as Response (response_model is for docs)
+
+# Sparse fieldsets, only the listed columns are selected and returned
+Fields = Annotated[list[schemas.InfrastructureVMsField] | None, Query(description="Columns to return, omit for all")]
 
 
 # TODO: Implement total count of VMs returned
@@ -24,23 +29,155 @@ router = APIRouter(prefix="/infrastructure", tags=["Infrastructure"])
     summary="Returns a list of all VMs in the environment",
 )
 async def get_all(
-    db_session: Annotated[AsyncSession, Depends(get_session)],
-) -> list[models.InfrastructureVMs]:
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+    fields: Fields = None,
+) -> list[schemas.InfrastructureVMsAll] | Response:
+
+    if fields is not None:
+        # Partial rows don't match response_model, service renders them
+        body = await services.get_all_fields(db_session, fields)
+        return Response(content=body, media_type="application/json")
 
     return await services.get_all(db_session)
 
 
+@router.get(
+    "/all/page",
+    response_model=schemas.InfrastructureVMsOut,
+    summary="Returns one page of all VMs, use next_cursor to fetch the following page",
+)
+async def get_all_page(
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+    limit: Annotated[int, Query(gt=0, le=10_000, description="Page size")] = 1_000,
+    cursor: Annotated[str | None, Query(description="next_cursor of the previous page")] = None,
+    fields: Fields = None,
+) -> Response:
+
+    body = await services.get_all_page(db_session, limit, cursor, fields)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/all/stream",
+    response_class=StreamingResponse,
+    summary="Streams all VMs in the environment as NDJSON or a JSON array",
+    responses={200: {"content": {"application/x-ndjson": {}, "application/json": {}}}},
+)
+async def get_all_stream(
+    db_session: Annotated[AsyncSession, Depends(get_session)],  # Server-side cursor needs a transaction, see ReadSession
+    format: Annotated[Literal["ndjson", "json"], Query(description="ndjson = one VM per line, json = single JSON array")] = "ndjson",
+    chunk_size: Annotated[int, Query(ge=1, le=50_000, description="Rows fetched from the DB cursor per chunk")] = 1_000,
+    fields: Fields = None,
+) -> StreamingResponse:
+
+    media_types = {"ndjson": "application/x-ndjson", "json": "application/json"}
+    body = await services.get_all_stream(db_session, format, chunk_size, fields)
+
+    return StreamingResponse(body, media_type=media_types[format])
+
+
 @router.post(
     "/vms",
-    response_model=schemas.InfrastructureVMsOut,  # Service already validates the model, however response_model also generates documentation, serializes do json etc. FastAPI also doesn't know what is returned from service, it enforces the contract at the endpoint layer. It protects API boundary
-    summary="Returns a single or a list of VMs",
+    response_model=schemas.InfrastructureVMsOut | schemas.InfrastructureVMsByWeekOut,  # Only documents the response, service renders JSON once
+    summary="Returns a single or a list of VMs of one or more fiscal weeks",
 )
 async def post_vms(
     # vm: Annotated[list[str], Query(title="dwqdwqdq", description="USE THIS FOR DESCRIPTION IN DOCS ")],§
     request: schemas.InfrastructureVMsIn,  # Annotated[list[str], Query(min_length=1)],
     # app_id: Annotated[list[int], Query(min_length=1)],
     # fisc_wk: Annotated[str, Query(openapi_examples={"fiscal month": {"value": "2026-M01"}})],
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> Response:
+
+    body = await services.post_vms(db_session, request)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.post(
+    "/vms/batch",
+    response_model=schemas.InfrastructureVMsBatchOut,  # Only documents the response, service renders JSON once
+    summary="Runs several VM lookups concurrently in one request, results are returned in order",
+)
+async def post_vms_batch(
+    request: schemas.InfrastructureVMsBatchIn,
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_read_session_factory)],
+) -> Response:
+
+    body = await services.post_vms_batch(session_factory, request)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/cost",
+    response_model=list[schemas.InfrastructureCost],  # Only documents the response, service renders JSON once
+    summary="Returns total and average VM cost grouped by role, fiscal week and/or fiscal year",
+)
+async def get_cost(
+    request: Annotated[schemas.InfrastructureCostIn, Query()],
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> Response:
+
+    body = await services.get_cost(db_session, request)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/cost/top",
+    response_model=list[schemas.InfrastructureCostTop],  # Only documents the response, service renders JSON once
+    summary="Returns VMs with the highest total cost",
+)
+async def get_cost_top(
+    request: Annotated[schemas.InfrastructureCostTopIn, Query()],
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> Response:
+
+    body = await services.get_cost_top(db_session, request)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/rollups",
+    response_model=schemas.InfrastructureRollups,
+    summary="Returns freshness of the cost rollups",
+)
+async def get_rollups(
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> schemas.InfrastructureRollups:
+
+    return await services.get_rollups(db_session)
+
+
+@router.post(
+    "/rollups/refresh",
+    response_model=schemas.InfrastructureRollupsRefresh,
+    summary="Refreshes the cost rollups, call after new fiscal weeks are loaded",
+    # Creates the rollup tables on first use and can rebuild them from scratch, needs a bearer token with the role
+    dependencies=[Depends(require_role(RoleNames.INFRASTRUCTURE_ADMIN))],
+)
+async def post_rollups_refresh(
+    request: schemas.InfrastructureRollupsRefreshIn,
     db_session: Annotated[AsyncSession, Depends(get_session)],
-) -> schemas.InfrastructureVMsOut:
+) -> schemas.InfrastructureRollupsRefresh:
+
+    return await services.post_rollups_refresh(db_session, request)
+
+
+@router.delete(
+    "/cache/{fisc_wk}",
+    response_model=schemas.InfrastructureCache,
+    summary="Invalidates cached VM lookups of a fiscal week and cost aggregates, call after the week is loaded",
+    # Flushing results spanning all weeks defeats the cache, needs a bearer token with the role.
+    # Caches are per worker process, only the worker handling the call is invalidated, the others serve their entries until
+    # cache_ttl_seconds expires them
+    dependencies=[Depends(require_role(RoleNames.INFRASTRUCTURE_ADMIN))],
+)
+async def delete_cache(
+    fisc_wk: Annotated[str, Path(openapi_examples={"fiscal week": {"value": "2026-W01"}})],
+) -> schemas.InfrastructureCache:
 
-    return await services.post_vms(db_session, request)
+    return services.delete_cache(fisc_wk)
@@ -1,5 +1,11 @@
 """Pydantic validation models"""
 
+from datetime import datetime
+from typing import Annotated, Literal, NotRequired, TypedDict
+
+from pydantic import Field, model_validator
+
+from app.core.config import settings
 from app.core.schemas import BaseSchema
 
 # ============================================
@@ -15,13 +21,210 @@ class InfrastructureVMsAll(BaseSchema):
     role: str | None
 
 
+class InfrastructureVMsRow(TypedDict):
+    """
+    Plain dict shape of InfrastructureVMsAll, used to serialize DB rows without building model instances.
+    Columns left out with fields= are missing from the dict and from the rendered JSON.
+    """
+
+    vm_name: str
+    fisc_wk: str
+    fisc_yr: str | None
+    cost: float | None
+    role: str | None
+
+
+# Columns of InfrastructureVMsAll which can be requested with fields=
+InfrastructureVMsField = Literal["vm_name", "fisc_wk", "fisc_yr", "cost", "role"]
+
+
 class InfrastructureVMsIn(BaseSchema):
+    """VMs matching all of the set week filters, at least one of fisc_wk, fisc_wk_from, fisc_wk_to and fisc_yr is required."""
 
     vm_name: list[str]
-    fisc_wk: str
+    fisc_wk: str | Annotated[list[str], Field(min_length=1)] | None = Field(
+        default=None,
+        description="Fiscal week or non-empty list of fiscal weeks",
+        examples=[["2026-W01", "2026-W02"]],
+    )
+    fisc_wk_from: str | None = Field(default=None, description="First fiscal week of a range (inclusive)", examples=["2026-W01"])
+    fisc_wk_to: str | None = Field(default=None, description="Last fiscal week of a range (inclusive)", examples=["2026-W13"])
+    fisc_yr: str | None = Field(default=None, examples=["FY26"])
+    group_by_week: bool = Field(default=False, description="Return VMs grouped by fiscal week, see InfrastructureVMsByWeekOut")
+    limit: int | None = Field(default=None, gt=0, description="Page size, omit to return all matching VMs")
+    cursor: str | None = Field(default=None, description="next_cursor of the previous page")
+    fields: list[InfrastructureVMsField] | None = Field(
+        default=None,
+        min_length=1,
+        description="Columns to return, omit for all. vm_name and fisc_wk are always returned with limit, fisc_wk with group_by_week",
+        examples=[["vm_name", "cost"]],
+    )
+
+    @model_validator(mode="after")
+    def check_weeks(self):
+        if self.fisc_wk is None and self.fisc_wk_from is None and self.fisc_wk_to is None and self.fisc_yr is None:
+            raise ValueError("One of fisc_wk, fisc_wk_from, fisc_wk_to or fisc_yr is required")
+        if self.fisc_wk_from is not None and self.fisc_wk_to is not None and self.fisc_wk_from > self.fisc_wk_to:
+            raise ValueError("fisc_wk_from must not be after fisc_wk_to")
+        return self
+
+    @property
+    def fisc_wks(self) -> list[str] | None:
+        """fisc_wk as a sorted, deduplicated list, None when not set."""
+        if self.fisc_wk is None:
+            return None
+
+        return sorted({self.fisc_wk} if isinstance(self.fisc_wk, str) else set(self.fisc_wk))
 
 
 class InfrastructureVMsOut(BaseSchema):
 
     total_count: int
     data: list[InfrastructureVMsAll]
+    next_cursor: str | None = None  # Set when there are more rows, send it back as cursor to get the next page
+
+
+class InfrastructureVMsWeek(BaseSchema):
+
+    fisc_wk: str
+    total_count: int
+    data: list[InfrastructureVMsAll]
+
+
+class InfrastructureVMsByWeekOut(BaseSchema):
+    """Response of post_vms with group_by_week, weeks are in ascending order."""
+
+    total_count: int
+    weeks: list[InfrastructureVMsWeek]
+    next_cursor: str | None = None
+
+
+class InfrastructureVMsBatchIn(BaseSchema):
+
+    requests: list[InfrastructureVMsIn] = Field(min_length=1, max_length=settings.batch_max_items)
+
+
+class InfrastructureVMsBatchItem(BaseSchema):
+    """Result of one sub-request, result is set on status_code 200, detail otherwise."""
+
+    status_code: int
+    detail: str | None = None
+    result: InfrastructureVMsOut | InfrastructureVMsByWeekOut | None = None
+
+
+class InfrastructureVMsBatchOut(BaseSchema):
+
+    results: list[InfrastructureVMsBatchItem]  # Same order as the requests
+
+
+class InfrastructureCache(BaseSchema):
+
+    fisc_wk: str
+    invalidated: int  # Number of dropped cache entries
+
+
+class InfrastructureVMsOutDict(TypedDict):
+    """Plain dict shape of InfrastructureVMsOut, serialized in one pass by the services."""
+
+    total_count: int
+    data: list[InfrastructureVMsRow]
+    next_cursor: str | None
+
+
+class InfrastructureVMsWeekDict(TypedDict):
+    """Plain dict shape of InfrastructureVMsWeek."""
+
+    fisc_wk: str
+    total_count: int
+    data: list[InfrastructureVMsRow]
+
+
+class InfrastructureVMsByWeekOutDict(TypedDict):
+    """Plain dict shape of InfrastructureVMsByWeekOut, serialized in one pass by the services."""
+
+    total_count: int
+    weeks: list[InfrastructureVMsWeekDict]
+    next_cursor: str | None
+
+
+class InfrastructureCostFilter(BaseSchema):
+    """Filters of the cost aggregates, omitted filters match everything."""
+
+    fisc_yr: str | None = Field(default=None, examples=["FY26"])
+    fisc_wk: str | None = Field(default=None, examples=["2026-W01"])
+    role: str | None = Field(default=None, examples=["SQL"])
+
+
+class InfrastructureCostIn(InfrastructureCostFilter):
+
+    group_by: list[Literal["role", "fisc_wk", "fisc_yr"]] = Field(default=["role"], min_length=1, description="Columns to aggregate by")
+    top: int | None = Field(default=None, gt=0, le=1_000, description="Return only N groups with the highest total cost")
+
+
+class InfrastructureCost(BaseSchema):
+    """Cost aggregate of one group, only the group_by columns are present."""
+
+    role: str | None = None
+    fisc_wk: str | None = None
+    fisc_yr: str | None = None
+    vm_count: int  # Distinct VMs in the group
+    total_cost: float
+    avg_cost: float | None  # Average cost of a VM in a fiscal week
+
+
+class InfrastructureCostRow(TypedDict):
+    """Plain dict shape of InfrastructureCost, group columns which are not grouped by are left out."""
+
+    role: NotRequired[str | None]
+    fisc_wk: NotRequired[str | None]
+    fisc_yr: NotRequired[str | None]
+    vm_count: int
+    total_cost: float
+    avg_cost: float | None
+
+
+class InfrastructureCostTopIn(InfrastructureCostFilter):
+
+    n: int = Field(default=10, gt=0, le=1_000, description="Number of VMs to return")
+
+
+class InfrastructureCostTop(BaseSchema):
+
+    vm_name: str
+    weeks: int  # Fiscal weeks the VM has cost in
+    total_cost: float
+    avg_cost: float | None  # Average cost per fiscal week
+
+
+class InfrastructureCostTopRow(TypedDict):
+    """Plain dict shape of InfrastructureCostTop."""
+
+    vm_name: str
+    weeks: int
+    total_cost: float
+    avg_cost: float | None
+
+
+class InfrastructureRollups(BaseSchema):
+
+    last_fisc_wk: str | None  # Latest fiscal week in the rollups
+    last_source_fisc_wk: str | None  # Latest fiscal week in v_infra_vms, rollups are stale while it is newer than last_fisc_wk
+    refreshed_at: datetime | None  # None until the first refresh
+    age_seconds: float | None
+    max_age_seconds: float
+    fresh: bool  # Cost aggregates are read from the rollups
+
+
+class InfrastructureRollupsRefreshIn(BaseSchema):
+
+    full: bool = Field(default=False, description="Rebuild the rollups from scratch")
+    fisc_wk: list[str] = Field(default=[], description="Reloaded fiscal weeks to aggregate again, omit to aggregate only new weeks")
+
+
+class InfrastructureRollupsRefresh(BaseSchema):
+
+    full: bool
+    fisc_wk: list[str]  # Aggregated fiscal weeks
+    fisc_yr: list[str | None]  # Recomputed fiscal years
+    duration_ms: float
+    invalidated: int  # Number of dropped cache entries
@@ -1,30 +1,320 @@
 """Service module."""
 
-from fastapi import HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import json
+from typing import AsyncIterator, Literal, Sequence
 
+from fastapi import HTTPException, status
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Float,
+    Integer,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    cast,
+    distinct,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import database
+from app.core.cache import ResultCache, TTLCache
+from app.core.config import settings
 from app.core.logger import logger
-from app.domains.infrastructure import models, schemas
-from app.utils import formatter
+from app.core.singleflight import SingleFlight
+from app.domains.infrastructure import models, rollups, schemas
+from app.utils import cursor as cursor_utils, formatter
 
 # ============================================
 # Naming convention of functions > Same as endpoint's function name (e.g. get_all)
 
+# VM reads are Core selects on the table of InfrastructureVMs, not on its mapped attributes. Statements skip the ORM compile
+# and loading steps entirely, rows come back as plain tuples and nothing is added to the identity map of the session
+VMS = models.InfrastructureVMs.__table__
+
+# Columns selected when rows are serialized directly, without hydrating ORM objects
+VM_COLUMNS = (VMS.c.vm_name, VMS.c.fisc_wk, VMS.c.fisc_yr, VMS.c.cost, VMS.c.role)
+
+# Serializers built once, rows are dumped straight to JSON bytes without model validation
+vm_row_adapter = TypeAdapter(schemas.InfrastructureVMsRow)
+vm_rows_adapter = TypeAdapter(list[schemas.InfrastructureVMsRow])
+vm_out_adapter = TypeAdapter(schemas.InfrastructureVMsOutDict)
+vm_by_week_out_adapter = TypeAdapter(schemas.InfrastructureVMsByWeekOutDict)
+
+# Concurrent identical queries (e.g. dashboards refreshing at once) share one DB query and one pool connection
+query_flight = SingleFlight()
+
+# Read-through cache of VM lookups, entries are tagged by fisc_wk so a newly loaded week can be invalidated
+vms_cache: ResultCache = TTLCache(max_entries=settings.cache_max_entries, ttl_seconds=settings.cache_ttl_seconds)
+
+# Tag of cached results spanning several fiscal weeks (e.g. cost aggregates of a fiscal year), invalidated with every week
+ALL_WEEKS_TAG = "*"
+
+# Columns cost aggregates can be grouped and filtered by, same names on v_infra_vms and the rollups
+COST_GROUP_COLUMNS = ("role", "fisc_wk", "fisc_yr")
+cost_adapter = TypeAdapter(list[schemas.InfrastructureCostRow])
+cost_top_adapter = TypeAdapter(list[schemas.InfrastructureCostTopRow])
+
+# Keyset pagination key, composite primary key of InfrastructureVMs (backed by its index)
+PAGE_KEY = (VMS.c.vm_name, VMS.c.fisc_wk)
+
+
+def in_values(column: ColumnElement, values: Sequence, dialect_name: str) -> ColumnElement[bool]:
+    """
+    column IN values, bound as a single array parameter on Postgres (column = ANY(:values)).
+
+    IN expands into one bind parameter per value, so every list length is a new SQL statement which is compiled and prepared
+    again, and thousands of values hit the bind parameter limit of asyncpg. The array keeps one cached, prepared statement
+    for any number of values and still uses the column's index.
+    """
+    if dialect_name != "postgresql":
+        return column.in_(values)
+
+    return column == any_(bindparam(f"{column.key}_values", list(values), type_=ARRAY(column.type)))
+
+
+def keyset_page(stmt: Select, limit: int, cursor: str | None) -> Select:
+    """
+    Restrict a select to a single page ordered by PAGE_KEY.
+
+    Instead of OFFSET, the page starts right after the key stored in the cursor ((vm_name, fisc_wk) > cursor), so the database
+    seeks the primary key index and every page costs the same regardless of how deep it is.
+    One extra row is fetched to find out whether there is a next page, see split_page().
+
+    Raises:
+        HTTPException: 400 when the cursor is malformed.
+    """
+    if cursor is not None:
+        try:
+            last_key = cursor_utils.decode_cursor(cursor, len(PAGE_KEY))
+        except ValueError as e:
+            logger.warning(formatter.format_error(e, "Invalid pagination cursor"))
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+        stmt = stmt.where(tuple_(*PAGE_KEY) > tuple_(*last_key))
+
+    return stmt.order_by(*PAGE_KEY).limit(limit + 1)
+
+
+def split_page(rows: Sequence, limit: int) -> tuple[Sequence, str | None]:
+    """
+    Split rows fetched by keyset_page() into the page and the cursor of the next page.
+
+    Returns:
+        tuple: Rows of the page (at most limit) and next_cursor, None when this is the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+
+    return rows, cursor_utils.encode_cursor(last.vm_name, last.fisc_wk)
+
+
+def vm_columns(fields: Sequence[str] | None, required: Sequence[str] = ()) -> tuple:
+    """
+    Columns of VM_COLUMNS projected by fields=, in VM_COLUMNS order and without duplicates.
+
+    Only the projected columns are selected and serialized, rows stay plain tuples as with VM_COLUMNS.
+
+    Args:
+        fields (Sequence[str] | None): Requested column names, None for all of VM_COLUMNS.
+        required (Sequence[str], optional): Columns always selected, e.g. the PAGE_KEY columns the cursor is built from.
+
+    Returns:
+        tuple: Columns to select.
+    """
+    if fields is None:
+        return VM_COLUMNS
+
+    names = set(fields) | set(required)
+
+    return tuple(column for column in VM_COLUMNS if column.key in names)
+
+
+def rows_as_dicts(rows: Sequence[Row]) -> list[dict]:
+    """Convert rows to dicts for the TypeAdapters, dict(zip()) is several times faster than Row._asdict()."""
+    if not rows:
+        return []
+
+    keys = rows[0]._fields
+
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def render_vms_out(rows: Sequence[Row], next_cursor: str | None = None) -> bytes:
+    """
+    Serialize rows selected with vm_columns() into an InfrastructureVMsOut JSON body.
+
+    Rows go straight from the DB tuples to JSON bytes in a single pass, without ORM objects, model validation
+    or the response_model round trip. Routers return the bytes as a pre-rendered Response.
+    """
+    return vm_out_adapter.dump_json(
+        {
+            "total_count": len(rows),
+            "data": rows_as_dicts(rows),
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+def render_vms_by_week(rows: Sequence[Row], next_cursor: str | None = None) -> bytes:
+    """Serialize rows selected with vm_columns() into an InfrastructureVMsByWeekOut JSON body, weeks in ascending order."""
+    weeks: dict[str, list[dict]] = {}
+    for row in rows_as_dicts(rows):
+        weeks.setdefault(row["fisc_wk"], []).append(row)
+
+    return vm_by_week_out_adapter.dump_json(
+        {
+            "total_count": len(rows),
+            "weeks": [{"fisc_wk": fisc_wk, "total_count": len(data), "data": data} for fisc_wk, data in sorted(weeks.items())],
+            "next_cursor": next_cursor,
+        }
+    )
+
 
 async def get_all(
     db_session: AsyncSession,
-) -> list[models.InfrastructureVMs]:
+    fields: Sequence[str] | None = None,
+) -> Sequence[Row]:
     """
     Returns all VMs.
 
+    Concurrent calls share one query through query_flight. Rows are returned instead of ORM objects, those would stay
+    bound to the session of the request which ran the query.
+
+    Args:
+        fields (Sequence[str] | None, optional): Columns to select, see vm_columns(). Defaults to all columns.
+
     Returns:
-        list: List of ORM models. Each element representing one row in table.
+        list: List of rows with the selected columns. Each element representing one row in table.
+    """
+    columns = vm_columns(fields)
+
+    return await query_flight.do(("get_all", *(column.key for column in columns)), lambda: fetch_all(db_session, columns))
+
+
+async def get_all_fields(
+    db_session: AsyncSession,
+    fields: Sequence[str],
+) -> bytes:
+    """
+    Returns all VMs with only the requested columns.
+
+    Rows with a subset of the columns don't validate against the response_model of get_all, so they are rendered here.
+
+    Returns:
+        bytes: JSON array of VMs with the columns in fields.
+    """
+    return vm_rows_adapter.dump_json(rows_as_dicts(await get_all(db_session, fields)))
+
+
+async def fetch_all(
+    db_session: AsyncSession,
+    columns: tuple = VM_COLUMNS,
+) -> Sequence[Row]:
+    """
+    Queries all VMs for get_all().
+
+    Returns:
+        list: List of rows with the columns.
+    """
+    try:
+        result = await db_session.execute(select(*columns))
+        return result.all()
+    except Exception as e:
+        msg = "Error fetching data from database"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
+        )
+
+
+async def get_all_page(
+    db_session: AsyncSession,
+    limit: int,
+    cursor: str | None,
+    fields: Sequence[str] | None = None,
+) -> bytes:
+    """
+    Returns one page of all VMs, ordered by (vm_name, fisc_wk).
+
+    Args:
+        fields (Sequence[str] | None, optional): Columns to return, vm_name and fisc_wk are always included for the cursor.
+            Defaults to all columns.
+
+    Returns:
+        bytes: JSON body of InfrastructureVMsOut containing:
+            - total_count: Number of records in this page
+            - data: List of VMs
+            - next_cursor: Cursor of the next page, None on the last page
+    """
+    columns = vm_columns(fields, required=[column.key for column in PAGE_KEY])
+    stmt = keyset_page(select(*columns), limit, cursor)
+    key = ("get_all_page", limit, cursor, *(column.key for column in columns))
+
+    return await query_flight.do(key, lambda: fetch_all_page(db_session, stmt, limit))
+
+
+async def fetch_all_page(
+    db_session: AsyncSession,
+    stmt: Select,
+    limit: int,
+) -> bytes:
+    """
+    Queries one page for get_all_page().
+
+    Returns:
+        bytes: JSON body of InfrastructureVMsOut.
+    """
+    try:
+        result = await db_session.execute(stmt)
+        rows, next_cursor = split_page(result.all(), limit)
+
+        return render_vms_out(rows, next_cursor)
+    except Exception as e:
+        msg = "Error fetching data from database"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
+        )
+
+
+async def get_all_stream(
+    db_session: AsyncSession,
+    media_type: Literal["ndjson", "json"],
+    chunk_size: int,
+    fields: Sequence[str] | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Streams all VMs using a server-side cursor.
+
+    Query is executed before the stream is returned, so database errors still end up as HTTP 500.
+    Rows are then fetched and serialized in chunks of chunk_size, memory stays flat regardless of the table size.
+
+    Args:
+        db_session (AsyncSession): Session which stays open until the stream is consumed.
+        media_type (str): "ndjson" for one JSON object per line, "json" for a single JSON array.
+        chunk_size (int): Number of rows fetched from the cursor and written at once.
+        fields (Sequence[str] | None, optional): Columns to stream, see vm_columns(). Defaults to all columns.
+
+    Returns:
+        AsyncIterator[bytes]: Encoded response body chunks.
     """
     try:
-        result = await db_session.execute(select(models.InfrastructureVMs))
-        result_scalars = result.scalars().all()
-        return result_scalars
+        stmt = select(*vm_columns(fields)).execution_options(yield_per=chunk_size)
+        result = await db_session.stream(stmt)
     except Exception as e:
         msg = "Error fetching data from database"
         logger.error(formatter.format_error(e, msg))
@@ -33,36 +323,329 @@ async def get_all(
             detail=msg,
         )
 
+    async def ndjson_chunks() -> AsyncIterator[bytes]:
+        async for partition in result.partitions():
+            yield b"".join(vm_row_adapter.dump_json(row) + b"\n" for row in rows_as_dicts(partition))
+
+    async def json_array_chunks() -> AsyncIterator[bytes]:
+        separator = b"["
+        async for partition in result.partitions():
+            # Dump the whole chunk as an array and strip its brackets, chunks are then joined with commas
+            yield separator + vm_rows_adapter.dump_json(rows_as_dicts(partition))[1:-1]
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in ndjson_chunks() if media_type == "ndjson" else json_array_chunks():
+                yield chunk
+        except Exception as e:
+            # Headers are already sent at this point, the only option is to log and abort the stream
+            logger.error(formatter.format_error(e, "Error streaming data from database"))
+            raise
+        finally:
+            await result.close()
+
+    return stream()
+
 
 async def post_vms(
     db_session: AsyncSession,
     request: schemas.InfrastructureVMsIn,  # Pydantic validates the incoming payload before the function run
-) -> schemas.InfrastructureVMsOut:
+) -> bytes:
     """
     Fetches VMs for the given criteria.
 
+    Week filters (list of weeks, range, fiscal year) are combined into a single query, so a quarter costs one round trip
+    instead of one request per week. When request.limit is set, only one page is returned, see keyset_page().
+    Rendered responses are cached in vms_cache by the normalized request (sorted, deduplicated vm_name and fisc_wk),
+    concurrent identical requests share one query. With request.fields, only those columns are selected and returned.
+
     Returns:
-        Instance of InfrastructureVMsOut: Pydantic response model containing:
-            - total_count: Number of matching records
-            - data: List of InfrastructureVMsAll Pydantic models
+        bytes: JSON body of InfrastructureVMsOut containing:
+            - total_count: Number of matching records (in this page when paginated)
+            - data: List of VMs
+            - next_cursor: Cursor of the next page, None on the last page or without pagination
+        or InfrastructureVMsByWeekOut with the VMs split into weeks when request.group_by_week is set.
+    """
+    vm_names = sorted(set(request.vm_name))
+    fisc_wks = request.fisc_wks
+    required = [column.key for column in PAGE_KEY] if request.limit is not None else []
+    if request.group_by_week:
+        required.append("fisc_wk")
+    columns = vm_columns(request.fields, required)
+    cache_key = (
+        "post_vms",
+        tuple(vm_names),
+        tuple(fisc_wks) if fisc_wks is not None else None,
+        request.fisc_wk_from,
+        request.fisc_wk_to,
+        request.fisc_yr,
+        request.group_by_week,
+        request.limit,
+        request.cursor,
+        tuple(column.key for column in columns),
+    )
+    # Results of listed weeks are invalidated with those weeks, ranges and years with every week
+    tags = tuple(fisc_wks) if fisc_wks is not None else (ALL_WEEKS_TAG,)
+
+    return await vms_cache.get_or_load(cache_key, lambda: fetch_vms(db_session, request, vm_names, fisc_wks, columns), tags=tags)
+
+
+async def fetch_vms(
+    db_session: AsyncSession,
+    request: schemas.InfrastructureVMsIn,
+    vm_names: list[str],
+    fisc_wks: list[str] | None,
+    columns: tuple = VM_COLUMNS,
+) -> bytes:
     """
+    Queries VMs for post_vms() on a cache miss, vm_names and fisc_wks are bound as one array each, see in_values().
+
+    Returns:
+        bytes: JSON body of InfrastructureVMsOut or InfrastructureVMsByWeekOut.
+    """
+    vms = VMS.c
+    dialect_name = db_session.bind.dialect.name
+
+    stmt = select(*columns).where(in_values(vms.vm_name, vm_names, dialect_name))
+    if fisc_wks is not None:
+        stmt = stmt.where(in_values(vms.fisc_wk, fisc_wks, dialect_name))
+    if request.fisc_wk_from is not None:
+        stmt = stmt.where(vms.fisc_wk >= request.fisc_wk_from)
+    if request.fisc_wk_to is not None:
+        stmt = stmt.where(vms.fisc_wk <= request.fisc_wk_to)
+    if request.fisc_yr is not None:
+        stmt = stmt.where(vms.fisc_yr == request.fisc_yr)
+    if request.limit is not None:
+        stmt = keyset_page(stmt, request.limit, request.cursor)
+
     try:
-        stmt = (
-            select(models.InfrastructureVMs)
-            .where(models.InfrastructureVMs.vm_name.in_(request.vm_name))
-            .where(models.InfrastructureVMs.fisc_wk == request.fisc_wk)
+        result = await db_session.execute(stmt)
+        rows = result.all()
+        next_cursor = None
+        if request.limit is not None:
+            rows, next_cursor = split_page(rows, request.limit)
+
+        if request.group_by_week:
+            return render_vms_by_week(rows, next_cursor)
+
+        return render_vms_out(rows, next_cursor)
+
+    except Exception as e:
+        msg = "Error fetching data from database"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
         )
+
+
+async def post_vms_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    request: schemas.InfrastructureVMsBatchIn,
+) -> bytes:
+    """
+    Runs post_vms() for every sub-request concurrently.
+
+    Every sub-request gets its own session (and pooled connection on a cache miss), at most settings.batch_max_concurrency
+    of them query at once, so a single batch can't take over the pool. Failed sub-requests don't fail the batch.
+
+    Returns:
+        bytes: JSON body of InfrastructureVMsBatchOut, results in the order of the requests.
+    """
+    semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
+
+    def error_item(status_code: int, detail: str) -> bytes:
+        return json.dumps({"status_code": status_code, "detail": detail, "result": None}, separators=(",", ":")).encode()
+
+    async def run(item: schemas.InfrastructureVMsIn) -> bytes:
+        async with semaphore:
+            try:
+                async with session_factory() as db_session:
+                    body = await post_vms(db_session, item)
+            except HTTPException as e:  # Already logged by post_vms()
+                return error_item(e.status_code, e.detail)
+            except Exception as e:  # E.g. failing session, raised outside of the query handling of post_vms()
+                msg = "Error fetching data from database"
+                logger.error(formatter.format_error(e, msg))
+                return error_item(status.HTTP_500_INTERNAL_SERVER_ERROR, msg)
+
+        # Sub-request bodies are already rendered, only wrapped
+        return b'{"status_code":200,"detail":null,"result":' + body + b"}"
+
+    results = await asyncio.gather(*[run(item) for item in request.requests])
+
+    return b'{"results":[' + b",".join(results) + b"]}"
+
+
+def cost_filters(model: type[models.Base], filters: schemas.InfrastructureCostFilter) -> list[ColumnElement[bool]]:
+    """WHERE conditions of the filters which are set, on columns of the model."""
+    conditions = []
+    for name in COST_GROUP_COLUMNS:
+        value = getattr(filters, name)
+        if value is not None:
+            conditions.append(getattr(model, name) == value)
+
+    return conditions
+
+
+def rollup_avg_cost(model: type[models.Base]) -> ColumnElement[float]:
+    """Average cost of a VM per fiscal week out of the pre-aggregated sums of a rollup."""
+    return func.sum(model.total_cost) / func.nullif(cast(func.sum(model.cost_count), Float), 0)
+
+
+def cost_tags(filters: schemas.InfrastructureCostFilter) -> tuple[str, ...]:
+    """Cache tags of an aggregate, a single week when filtered by it, otherwise every week."""
+    return (filters.fisc_wk,) if filters.fisc_wk is not None else (ALL_WEEKS_TAG,)
+
+
+async def get_cost(
+    db_session: AsyncSession,
+    request: schemas.InfrastructureCostIn,
+) -> bytes:
+    """
+    Returns total and average cost grouped by request.group_by, ordered by total cost (highest first).
+
+    GROUP BY runs in the database, only one row per group is transferred. Results are cached in vms_cache.
+    Aggregates are read from the cost rollups while those are fresh, see cost_stmt().
+
+    Returns:
+        bytes: JSON list of InfrastructureCost.
+    """
+    group_by = tuple(dict.fromkeys(request.group_by))  # Deduplicated, order kept
+    cache_key = ("get_cost", group_by, request.fisc_yr, request.fisc_wk, request.role, request.top)
+
+    return await vms_cache.get_or_load(cache_key, lambda: fetch_cost(db_session, request, group_by), tags=cost_tags(request))
+
+
+async def fetch_cost(
+    db_session: AsyncSession,
+    request: schemas.InfrastructureCostIn,
+    group_by: tuple[str, ...],
+) -> bytes:
+    """
+    Queries cost aggregates for get_cost() on a cache miss.
+
+    Returns:
+        bytes: JSON list of InfrastructureCost.
+    """
+    try:
+        stmt = await cost_stmt(db_session, request, group_by)
         result = await db_session.execute(stmt)
-        result_scalars = result.scalars().all()
+        return cost_adapter.dump_json(rows_as_dicts(result.all()))
+
+    except Exception as e:
+        msg = "Error fetching data from database"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
+        )
+
+
+async def cost_stmt(
+    db_session: AsyncSession,
+    request: schemas.InfrastructureCostIn,
+    group_by: tuple[str, ...],
+) -> Select:
+    """
+    Select of the cost aggregate, over the rollups when they are fresh and can answer it exactly, otherwise over v_infra_vms.
+
+    Distinct VM counts don't add up over fiscal weeks, so:
+        * infra_cost_wk_role answers aggregates by or filtered to fiscal week (a VM has one row per week)
+        * infra_cost_yr_vm answers aggregates by or filtered to fiscal year (a VM has one row per year and role, VMs which
+          changed role within the year are counted once by counting distinct vm_name)
+        * the rest (e.g. by role over all years) is aggregated from v_infra_vms
+    """
+    if await rollups.fresh(db_session):
+        if "fisc_wk" in group_by or request.fisc_wk is not None:
+            model = models.InfrastructureCostWeekRole
+            vm_count = cast(func.sum(model.vm_count), Integer)
+        elif "fisc_yr" in group_by or request.fisc_yr is not None:
+            model = models.InfrastructureCostYearVM
+            vm_count = func.count(distinct(model.vm_name))
+        else:
+            model = None
+
+        if model is not None:
+            columns = [getattr(model, name).label(name) for name in group_by]
+            total_cost = func.coalesce(func.sum(model.total_cost), 0).label("total_cost")
+            return (
+                select(*columns, vm_count.label("vm_count"), total_cost, rollup_avg_cost(model).label("avg_cost"))
+                .where(*cost_filters(model, request))
+                .group_by(*columns)
+                .order_by(total_cost.desc(), *columns)
+                .limit(request.top)
+            )
+
+    vms = models.InfrastructureVMs
+    columns = [getattr(vms, name).label(name) for name in group_by]
+    total_cost = func.coalesce(func.sum(vms.cost), 0).label("total_cost")
+
+    return (
+        select(
+            *columns,
+            func.count(distinct(vms.vm_name)).label("vm_count"),
+            total_cost,
+            func.avg(vms.cost).label("avg_cost"),
+        )
+        .where(*cost_filters(vms, request))
+        .group_by(*columns)
+        .order_by(total_cost.desc(), *columns)
+        .limit(request.top)
+    )
+
+
+async def get_cost_top(
+    db_session: AsyncSession,
+    request: schemas.InfrastructureCostTopIn,
+) -> bytes:
+    """
+    Returns request.n VMs with the highest total cost matching the filters.
+
+    Read from infra_cost_yr_vm while the rollups are fresh and no fiscal week filter is set.
+
+    Returns:
+        bytes: JSON list of InfrastructureCostTop.
+    """
+    cache_key = ("get_cost_top", request.fisc_yr, request.fisc_wk, request.role, request.n)
+
+    return await vms_cache.get_or_load(cache_key, lambda: fetch_cost_top(db_session, request), tags=cost_tags(request))
+
+
+async def fetch_cost_top(
+    db_session: AsyncSession,
+    request: schemas.InfrastructureCostTopIn,
+) -> bytes:
+    """
+    Queries top VMs by cost for get_cost_top() on a cache miss.
+
+    Returns:
+        bytes: JSON list of InfrastructureCostTop.
+    """
+    try:
+        if request.fisc_wk is None and await rollups.fresh(db_session):
+            model = models.InfrastructureCostYearVM
+            weeks = cast(func.sum(model.weeks), Integer)
+            total_cost = func.coalesce(func.sum(model.total_cost), 0).label("total_cost")
+            avg_cost = rollup_avg_cost(model)
+        else:
+            model = models.InfrastructureVMs
+            weeks = func.count()
+            total_cost = func.coalesce(func.sum(model.cost), 0).label("total_cost")
+            avg_cost = func.avg(model.cost)
 
-        result_pydantic = schemas.InfrastructureVMsOut(
-            total_count=len(result_scalars),
-            data=[schemas.InfrastructureVMsAll.model_validate(vm) for vm in result_scalars],
+        stmt = (
+            select(model.vm_name, weeks.label("weeks"), total_cost, avg_cost.label("avg_cost"))
+            .where(*cost_filters(model, request))
+            .group_by(model.vm_name)
+            .order_by(total_cost.desc(), model.vm_name)
+            .limit(request.n)
         )
-        print(result_pydantic.data)
-        print(type(result_pydantic.data[0]))
 
-        return result_pydantic
+        result = await db_session.execute(stmt)
+        return cost_top_adapter.dump_json(rows_as_dicts(result.all()))
 
     except Exception as e:
         msg = "Error fetching data from database"
@@ -73,6 +656,105 @@ async def post_vms(
         )
 
 
+async def get_rollups(
+    db_session: AsyncSession,
+) -> schemas.InfrastructureRollups:
+    """
+    Returns freshness of the cost rollups, read from the database (not the per worker cached state).
+
+    Returns:
+        Instance of InfrastructureRollups.
+    """
+    state = await rollups.get_state(db_session)
+    last_source_wk = await rollups.source_last_fisc_wk(db_session)
+
+    return schemas.InfrastructureRollups(
+        last_fisc_wk=state.last_fisc_wk if state else None,
+        last_source_fisc_wk=last_source_wk,
+        refreshed_at=state.refreshed_at if state else None,
+        age_seconds=rollups.age_seconds(state) if state else None,
+        max_age_seconds=settings.rollup_max_age_seconds,
+        fresh=rollups.is_fresh(state, last_source_wk),
+    )
+
+
+async def post_rollups_refresh(
+    db_session: AsyncSession,
+    request: schemas.InfrastructureRollupsRefreshIn,
+) -> schemas.InfrastructureRollupsRefresh:
+    """
+    Refreshes the cost rollups, new fiscal weeks only unless request.full or request.fisc_wk are set.
+
+    Returns:
+        Instance of InfrastructureRollupsRefresh: Aggregated weeks, recomputed years and number of dropped cache entries.
+    """
+    try:
+        result = await rollups.refresh(db_session, request.full, request.fisc_wk)
+    except Exception as e:
+        msg = "Error refreshing rollups"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
+        )
+
+    return schemas.InfrastructureRollupsRefresh(**result, invalidated=invalidate_weeks(result["fisc_wk"]))
+
+
+def invalidate_weeks(fisc_wks: Sequence[str]) -> int:
+    """
+    Drop cached results of the fiscal weeks and results spanning all weeks, nothing when no week changed.
+
+    Returns:
+        int: Number of dropped cache entries.
+    """
+    if not fisc_wks:
+        return 0
+
+    return sum(vms_cache.invalidate_tag(fisc_wk) for fisc_wk in fisc_wks) + vms_cache.invalidate_tag(ALL_WEEKS_TAG)
+
+
+async def refresh_rollups_loop():
+    """Refresh the rollups incrementally every rollup_refresh_interval seconds, picks up newly loaded fiscal weeks."""
+    while True:
+        await asyncio.sleep(settings.rollup_refresh_interval)
+        try:
+            async with database.async_session_factory() as db_session:
+                result = await rollups.refresh(db_session)
+            invalidate_weeks(result["fisc_wk"])
+        except Exception as e:
+            logger.warning(formatter.format_error(e, "Background rollup refresh failed"))
+
+
+def start_rollup_refresh() -> asyncio.Task | None:
+    """
+    Start refresh_rollups_loop() when rollup_refresh_interval is set.
+
+    Returns:
+        asyncio.Task | None: Task to cancel on shutdown, None when rollups are only refreshed on request.
+    """
+    if settings.rollup_refresh_interval <= 0:
+        return None
+
+    return asyncio.create_task(refresh_rollups_loop(), name="rollup-refresh")
+
+
+def delete_cache(fisc_wk: str) -> schemas.InfrastructureCache:
+    """
+    Invalidates cached VM lookups of a fiscal week and cached results spanning all weeks, call it after the week is (re)loaded.
+    Freshness of the rollups is checked again, a new week is aggregated from v_infra_vms until the rollups are refreshed.
+    Caches are per worker process, other workers serve their cached results until those expire (cache_ttl_seconds).
+
+    Returns:
+        Instance of InfrastructureCache: Fiscal week and number of dropped cache entries.
+    """
+    invalidated = vms_cache.invalidate_tag(fisc_wk) + vms_cache.invalidate_tag(ALL_WEEKS_TAG)
+    rollups.state_cache.clear()
+    logger.info(f"Invalidated {invalidated} cached VM lookups of {fisc_wk}")
+
+    return schemas.InfrastructureCache(fisc_wk=fisc_wk, invalidated=invalidated)
+
+
 #     {
 #   "vm_name": [
 #     "vm_1", "vm_2"
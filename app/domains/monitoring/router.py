@@ -0,0 +1,48 @@
+from fastapi import APIRouter
+
+from app.domains.monitoring import schemas, services
+
+router = APIRouter(prefix="/monitoring", tags=["Monitoring"])
+
+# ============================================
+# Naming convention of functions > method + endpoint (e.g. get_pool)
+
+
+@router.get(
+    "/pool",
+    response_model=schemas.MonitoringPool,
+    summary="Returns connection pool usage: checked out connections, overflow, checkout wait and hold times",
+)
+async def get_pool() -> schemas.MonitoringPool:
+
+    return services.get_pool()
+
+
+@router.get(
+    "/cache",
+    response_model=schemas.MonitoringCache,
+    summary="Returns infrastructure result cache statistics: entries, hits, misses and evictions",
+)
+async def get_cache() -> schemas.MonitoringCache:
+
+    return services.get_cache()
+
+
+@router.get(
+    "/auth",
+    response_model=schemas.MonitoringCache,
+    summary="Returns statistics of the token roles cache: cached tokens, hits, misses and coalesced checks",
+)
+async def get_auth() -> schemas.MonitoringCache:
+
+    return services.get_auth()
+
+
+@router.get(
+    "/singleflight",
+    response_model=schemas.MonitoringSingleFlight,
+    summary="Returns how many identical concurrent infrastructure queries were coalesced into one",
+)
+async def get_singleflight() -> schemas.MonitoringSingleFlight:
+
+    return services.get_singleflight()
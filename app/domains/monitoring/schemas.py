@@ -0,0 +1,38 @@
+"""Pydantic validation models"""
+
+from app.core.schemas import BaseSchema
+
+# ============================================
+# Naming convention > FolderName + RouterEndpoint (e.g. MonitoringPool)
+
+
+class MonitoringPool(BaseSchema):
+
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_avg_ms: float
+    wait_time_max_ms: float
+    hold_time_avg_ms: float  # Checkout to checkin, includes time the connection sits idle while held
+    hold_time_max_ms: float
+
+
+class MonitoringCache(BaseSchema):
+
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    coalesced: int  # Misses which waited for an identical query already in flight
+    evictions: int
+
+
+class MonitoringSingleFlight(BaseSchema):
+
+    calls: int  # Queries executed
+    coalesced: int  # Requests which awaited an identical query already in flight instead of running their own
+    inflight: int
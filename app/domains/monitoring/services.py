@@ -0,0 +1,48 @@
+"""Service module."""
+
+from app.core import database, security
+from app.domains.infrastructure import services as infrastructure_services
+from app.domains.monitoring import schemas
+
+# ============================================
+# Naming convention of functions > Same as endpoint's function name (e.g. get_pool)
+
+
+def get_pool() -> schemas.MonitoringPool:
+    """
+    Returns state of the database connection pool.
+
+    Returns:
+        Instance of MonitoringPool: Current connections and cumulative checkout statistics since app start.
+    """
+    return schemas.MonitoringPool(**database.pool_status())
+
+
+def get_cache() -> schemas.MonitoringCache:
+    """
+    Returns statistics of the infrastructure result cache.
+
+    Returns:
+        Instance of MonitoringCache: Entries, hit/miss counters and evictions since app start.
+    """
+    return schemas.MonitoringCache(**infrastructure_services.vms_cache.stats())
+
+
+def get_auth() -> schemas.MonitoringCache:
+    """
+    Returns statistics of the token roles cache of bearer token authorization.
+
+    Returns:
+        Instance of MonitoringCache: Cached tokens, hits, misses (introspection calls) and coalesced checks since app start.
+    """
+    return schemas.MonitoringCache(**security.roles_cache.stats())
+
+
+def get_singleflight() -> schemas.MonitoringSingleFlight:
+    """
+    Returns request coalescing counters of uncached infrastructure queries (cached lookups are coalesced by the cache itself).
+
+    Returns:
+        Instance of MonitoringSingleFlight: Executed and coalesced queries since app start.
+    """
+    return schemas.MonitoringSingleFlight(**infrastructure_services.query_flight.stats())
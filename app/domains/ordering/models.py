@@ -0,0 +1,33 @@
+"""SQL ORM Models for ordering data pulls from db"""
+
+from datetime import date
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+# ============================================
+# Naming convention > FolderName + TableDescription (e.g. OrderingSrfOrderDetails)
+
+
+class OrderingSrfOrderDetails(Base):
+    """SRF orders with their shipping and delivery dates."""
+
+    __tablename__ = "V_iDEAAPI_SRF_Order_Details"
+
+    srf_number: Mapped[str | None]
+    order_number: Mapped[str | None] = mapped_column(primary_key=True, nullable=True)
+    bu_id: Mapped[int | None]
+    tracking_link: Mapped[str | None]
+    service_tags: Mapped[str | None]
+    order_status: Mapped[str | None]
+    order_date: Mapped[date | None]
+    cancel_date: Mapped[date | None]
+    cancel_reason: Mapped[str | None]
+    estimated_ship_date: Mapped[date | None]
+    shipped_date: Mapped[date | None]
+    estimated_delivery_date: Mapped[date | None]
+    delivery_date: Mapped[date | None]
+    revised_ship_date: Mapped[date | None]
+    revised_delivery_date: Mapped[date | None]
+    delivery_status: Mapped[str | None]
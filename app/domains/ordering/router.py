@@ -0,0 +1,118 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.openapi.models import Example
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_read_session
+from app.core.security import RoleNames, require_role
+from app.domains.ordering import schemas, services
+
+# Every ordering endpoint needs a bearer token with the ordering role, see app/core/security.py
+router = APIRouter(prefix="/ordering", tags=["Ordering"], dependencies=[Depends(require_role(RoleNames.ORDERING))])
+
+# ============================================
+# Naming convention of functions > method + endpoint (e.g. get_order_by_srf)
+
+order_status_examples: dict[str, Example] = {
+    "Cancelled": {"value": "Cancelled"},
+    "In Production": {"value": "In Production"},
+    "Invoiced": {"value": "Invoiced"},
+    "Manifested": {"value": "Manifested"},
+    "Manufacturing Invoiced": {"value": "Manufacturing Invoiced"},
+    "Pending Production": {"value": "Pending Production"},
+    "Production Complete": {"value": "Production Complete"},
+    "Rejected": {"value": "Rejected"},
+    "Ship Complete": {"value": "Ship Complete"},
+    "Waiting Order Fulfillment": {"value": "Waiting Order Fulfillment"},
+}
+
+Skip = Annotated[int, Query(ge=0, description="Number of orders to skip")]
+Limit = Annotated[int, Query(gt=0, description="Maximum number of orders returned")]
+
+
+@router.get(
+    "/",
+    response_model=list[schemas.OrderingOrders],
+    summary="Returns all orders, ordered by order number",
+)
+async def get_all_orders(
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+    skip: Skip = 0,
+    limit: Limit = 1000,
+) -> list[schemas.OrderingOrders]:
+
+    return await services.get_all_orders(db_session, skip, limit)
+
+
+@router.get(
+    "/page",
+    response_model=schemas.OrderingPage,  # Only documents the response, service renders JSON once
+    summary="Returns one page of orders filtered by SRF, status and/or order number with total_count, use next_cursor for the next page",
+)
+async def get_orders_page(
+    request: Annotated[schemas.OrderingPageIn, Query()],
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> Response:
+
+    body = await services.get_orders_page(db_session, request)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "/srf/{srf_number}",
+    response_model=list[schemas.OrderingOrders],
+    summary="Returns orders of an SRF",
+)
+async def get_order_by_srf(
+    srf_number: Annotated[str, Path(description="SRF number to filter by")],
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+    skip: Skip = 0,
+    limit: Limit = 1000,
+) -> list[schemas.OrderingOrders]:
+
+    return await services.get_order_by_srf(db_session, skip, limit, srf_number)
+
+
+@router.get(
+    "/order/{order_number}",
+    response_model=list[schemas.OrderingOrders],
+    summary="Returns orders with the order number",
+)
+async def get_order_by_order_number(
+    order_number: str,
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+    skip: Skip = 0,
+    limit: Limit = 1000,
+) -> list[schemas.OrderingOrders]:
+
+    return await services.get_order_by_order_number(db_session, skip, limit, order_number)
+
+
+@router.get(
+    "/status/{order_status}",
+    response_model=list[schemas.OrderingOrders],
+    summary="Returns orders in the order status",
+)
+async def get_order_by_order_status(
+    order_status: Annotated[str, Path(openapi_examples=order_status_examples)],
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+    skip: Skip = 0,
+    limit: Limit = 1000,
+) -> list[schemas.OrderingOrders]:
+
+    return await services.get_order_by_order_status(db_session, skip, limit, order_status)
+
+
+@router.get(
+    "/track/{order_number}",
+    response_model=str | None,
+    summary="Returns tracking URL of an order, null when there is none",
+)
+async def get_order_tracking_link(
+    order_number: str,
+    db_session: Annotated[AsyncSession, Depends(get_read_session)],
+) -> str | None:
+
+    return await services.get_order_tracking_link(db_session, order_number)
@@ -0,0 +1,83 @@
+"""Pydantic validation models"""
+
+from datetime import date
+from typing import Literal, TypedDict
+
+from pydantic import Field
+
+from app.core.schemas import BaseSchema
+
+# ============================================
+# Naming convention > FolderName + RouterEndpoint (e.g. OrderingOrders)
+
+
+class OrderingOrders(BaseSchema):
+
+    srf_number: str | None
+    order_number: str | None
+    bu_id: int | None
+    tracking_link: str | None
+    service_tags: str | None
+    order_status: str | None
+    order_date: date | None
+    cancel_date: date | None
+    cancel_reason: str | None
+    estimated_ship_date: date | None
+    shipped_date: date | None
+    estimated_delivery_date: date | None
+    delivery_date: date | None
+    revised_ship_date: date | None
+    revised_delivery_date: date | None
+    delivery_status: str | None
+
+
+class OrderingOrdersRow(TypedDict):
+    """Plain dict shape of OrderingOrders, used to serialize DB rows without building model instances."""
+
+    srf_number: str | None
+    order_number: str | None
+    bu_id: int | None
+    tracking_link: str | None
+    service_tags: str | None
+    order_status: str | None
+    order_date: date | None
+    cancel_date: date | None
+    cancel_reason: str | None
+    estimated_ship_date: date | None
+    shipped_date: date | None
+    estimated_delivery_date: date | None
+    delivery_date: date | None
+    revised_ship_date: date | None
+    revised_delivery_date: date | None
+    delivery_status: str | None
+
+
+class OrderingPageIn(BaseSchema):
+    """Orders matching all of the set filters, one page ordered by order_number."""
+
+    srf_number: str | None = None
+    order_status: str | None = Field(default=None, examples=["Invoiced"])
+    order_number: str | None = None
+    limit: int = Field(default=1000, gt=0, le=10_000, description="Page size")
+    cursor: str | None = Field(default=None, description="next_cursor of the previous page")
+    count: Literal["exact", "estimate", "none"] = Field(
+        default="exact",
+        description="total_count of all pages: exact = counted in the page query, estimate = planner estimate (Postgres), none = skip",
+    )
+
+
+class OrderingPage(BaseSchema):
+
+    total_count: int | None  # Orders matching the filters on all pages, None with count=none
+    total_count_estimated: bool = False
+    data: list[OrderingOrders]
+    next_cursor: str | None = None  # Set when there are more rows, send it back as cursor to get the next page
+
+
+class OrderingPageDict(TypedDict):
+    """Plain dict shape of OrderingPage, serialized in one pass by the services."""
+
+    total_count: int | None
+    total_count_estimated: bool
+    data: list[OrderingOrdersRow]
+    next_cursor: str | None
@@ -0,0 +1,220 @@
+"""Service module."""
+
+import json
+from typing import Sequence
+
+from fastapi import HTTPException, status
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, Row, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import logger
+from app.domains.ordering import models, schemas
+from app.utils import cursor as cursor_utils, formatter
+
+# ============================================
+# Naming convention of functions > Same as endpoint's function name (e.g. get_all_orders)
+
+# Orders are read with Core selects on the table, rows are never hydrated into ORM objects
+ORDERS = models.OrderingSrfOrderDetails.__table__
+
+# Columns get_orders_page() filters by, same names as the OrderingPageIn fields
+PAGE_FILTER_COLUMNS = ("srf_number", "order_status", "order_number")
+page_adapter = TypeAdapter(schemas.OrderingPageDict)
+
+
+async def fetch_orders(
+    db_session: AsyncSession,
+    skip: int,
+    limit: int,
+    *conditions: ColumnElement[bool],
+) -> Sequence[Row]:
+    """
+    Queries one OFFSET page of orders matching all conditions, ordered by order_number.
+
+    Args:
+        db_session (AsyncSession): Session to query with.
+        skip (int): Number of rows to skip.
+        limit (int): Maximum number of rows returned.
+        *conditions (ColumnElement[bool]): WHERE conditions, all orders when none are given.
+
+    Returns:
+        list: List of order rows, empty at the end.
+    """
+    stmt = select(ORDERS).where(*conditions).order_by(ORDERS.c.order_number).offset(skip).limit(limit)
+
+    try:
+        result = await db_session.execute(stmt)
+        return result.all()
+    except Exception as e:
+        msg = "Error fetching data from database"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
+        )
+
+
+async def get_all_orders(db_session: AsyncSession, skip: int, limit: int) -> Sequence[Row]:
+    """Returns one page of all orders."""
+    return await fetch_orders(db_session, skip, limit)
+
+
+async def get_order_by_srf(db_session: AsyncSession, skip: int, limit: int, srf_number: str) -> Sequence[Row]:
+    """Returns one page of the orders of an SRF."""
+    return await fetch_orders(db_session, skip, limit, ORDERS.c.srf_number == srf_number)
+
+
+async def get_order_by_order_number(db_session: AsyncSession, skip: int, limit: int, order_number: str) -> Sequence[Row]:
+    """Returns one page of the orders with the order number."""
+    return await fetch_orders(db_session, skip, limit, ORDERS.c.order_number == order_number)
+
+
+async def get_order_by_order_status(db_session: AsyncSession, skip: int, limit: int, order_status: str) -> Sequence[Row]:
+    """Returns one page of the orders in the status."""
+    return await fetch_orders(db_session, skip, limit, ORDERS.c.order_status == order_status)
+
+
+async def get_order_tracking_link(
+    db_session: AsyncSession,
+    order_number: str,
+) -> str | None:
+    """
+    Returns tracking link of an order.
+
+    Returns:
+        str | None: Tracking URL, None when the order doesn't exist or has no link.
+    """
+    stmt = select(ORDERS.c.tracking_link).where(ORDERS.c.order_number == order_number)
+
+    try:
+        result = await db_session.execute(stmt)
+        return result.scalar() or None
+    except Exception as e:
+        msg = "Error fetching data from database"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
+        )
+
+
+def page_conditions(request: schemas.OrderingPageIn) -> list[ColumnElement[bool]]:
+    """WHERE conditions of the filters which are set. Orders without order_number can't be paged by it and are left out."""
+    conditions = [ORDERS.c[name] == getattr(request, name) for name in PAGE_FILTER_COLUMNS if getattr(request, name) is not None]
+
+    return [*conditions, ORDERS.c.order_number.is_not(None)]
+
+
+def page_stmt(conditions: Sequence[ColumnElement[bool]], limit: int, after: str | None, with_count: bool) -> Select:
+    """
+    Keyset page of orders: at most limit + 1 orders with order_number after the cursor, ordered by order_number.
+
+    Instead of OFFSET, the page starts right after the last order_number of the previous page, so with an index on
+    (filter column, order_number) every page costs the same regardless of how deep it is. One extra row tells whether
+    there is a next page.
+
+    With with_count, every row carries total_count of all matching orders (all pages), counted by an uncorrelated scalar
+    subquery in the same statement. Unlike count(*) over () around the page, which has to materialize every matching row
+    with all its columns before the keyset condition, the subquery is counted once on the index alone.
+    """
+    stmt = select(ORDERS).where(*conditions)
+    if with_count:
+        total_count = select(func.count()).select_from(ORDERS).where(*conditions).correlate(None).scalar_subquery()
+        stmt = stmt.add_columns(total_count.label("total_count"))
+
+    if after is not None:
+        stmt = stmt.where(ORDERS.c.order_number > after)
+
+    return stmt.order_by(ORDERS.c.order_number).limit(limit + 1)
+
+
+async def estimate_count(db_session: AsyncSession, conditions: Sequence[ColumnElement[bool]]) -> int:
+    """
+    Number of matching orders as estimated by the Postgres planner (EXPLAIN), no rows are read.
+
+    Estimates come from the table statistics (ANALYZE), they are off by a few percent, more on skewed or stale data.
+    """
+    connection = await db_session.connection()
+    compiled = select(ORDERS.c.order_number).where(*conditions).compile(dialect=connection.dialect)
+    params = tuple(compiled.params[name] for name in compiled.positiontup)  # asyncpg binds positionally ($1, $2, ...)
+
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):  # json is returned as text without a type codec
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def get_orders_page(
+    db_session: AsyncSession,
+    request: schemas.OrderingPageIn,
+) -> bytes:
+    """
+    Returns one page of orders matching the filters of the request, ordered by order_number.
+
+    The page and total_count come from one query, see page_stmt(). For huge result sets, request.count = "estimate"
+    keeps the page query on the index and takes the count from the planner, see estimate_count().
+    Estimates are Postgres only, other databases count exactly.
+
+    Returns:
+        bytes: JSON body of OrderingPage containing:
+            - total_count: Number of matching orders on all pages, None with count = "none"
+            - total_count_estimated: Whether total_count is the planner estimate
+            - data: List of orders
+            - next_cursor: Cursor of the next page, None on the last page
+    """
+    after = None
+    if request.cursor is not None:
+        try:
+            (after,) = cursor_utils.decode_cursor(request.cursor, 1)
+        except ValueError as e:
+            logger.warning(formatter.format_error(e, "Invalid pagination cursor"))
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            )
+
+    conditions = page_conditions(request)
+    count = request.count
+    if count == "estimate" and db_session.bind.dialect.name != "postgresql":
+        count = "exact"
+
+    try:
+        total_count = await estimate_count(db_session, conditions) if count == "estimate" else None
+
+        result = await db_session.execute(page_stmt(conditions, request.limit, after, count == "exact"))
+        keys = tuple(result.keys())
+        data = [dict(zip(keys, row)) for row in result.all()]
+
+        if count == "exact":
+            for order in data:
+                total_count = order.pop("total_count")
+            if not data and after is not None:
+                # Cursor is past the last match, there is no row carrying the count
+                result = await db_session.execute(select(func.count()).select_from(ORDERS).where(*conditions))
+                total_count = result.scalar()
+            elif not data:
+                total_count = 0
+    except Exception as e:
+        msg = "Error fetching data from database"
+        logger.error(formatter.format_error(e, msg))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=msg,
+        )
+
+    next_cursor = None
+    if len(data) > request.limit:
+        data = data[: request.limit]
+        next_cursor = cursor_utils.encode_cursor(data[-1]["order_number"])
+
+    return page_adapter.dump_json(
+        {
+            "total_count": total_count,
+            "total_count_estimated": count == "estimate",
+            "data": data,
+            "next_cursor": next_cursor,
+        }
+    )
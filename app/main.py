@@ -3,8 +3,10 @@ from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
 
 from app.api.api import api_router
+from app.core import database
 from app.core.config import settings
 from app.core.logger import configure_uvicorn_logging, logger, setup_logger, shutdown_logger
+from app.domains.infrastructure import services as infrastructure_services
 from app.middleware.logging import LoggingMiddleware
 
 
@@ -15,11 +17,20 @@ async def lifespan(app: FastAPI):
     logger.info("Initializing resources before the app start...")
     setup_logger()
     configure_uvicorn_logging()
+    database.init_engine()  # Engine and its pool belong to this process, workers each create their own
+    health_check_task = database.start_health_check()
+    rollup_refresh_task = infrastructure_services.start_rollup_refresh()
     logger.success("Resources initialized.")
 
     yield  # Application runs here
 
     logger.info("Cleaning up resources on app shutdown...")
+    if health_check_task:
+        health_check_task.cancel()
+    if rollup_refresh_task:
+        rollup_refresh_task.cancel()
+    logger.info(f"Connection pool at shutdown: {database.pool_status()}")
+    await database.dispose_engine()
     shutdown_logger()
     logger.success("Resources cleaned up.")
 
@@ -35,6 +46,7 @@ app.add_middleware(LoggingMiddleware)
 
 app.include_router(api_router)
 
+# Single process for development, production runs several workers through app/server.py
 if __name__ == "__main__":
     uvicorn.run(
         app=app,
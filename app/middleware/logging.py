@@ -1,67 +1,159 @@
 """Logging middleware acts as a request/response logger and tracer."""
 
+import json
+import random
 import time
-import uuid
-from typing import Callable
 
-from fastapi import Request, Response
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware, _StreamingResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.logger import request_id_var
+from app.core.config import get_settings
+from app.core.logger import new_request_id, request_id_var
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware, wraps send/receive directly.
+
+    Unlike BaseHTTPMiddleware, the response is not re-wrapped into a streaming response, no extra task group or memory stream
+    is created per request and streaming responses keep their back-pressure.
+
+    Access log format is chosen by settings.access_log_mode:
+        * text - request line and response line for every request
+        * json - one JSON record per request once the response is sent, fast successful requests are sampled by
+          settings.access_log_sample_rate, errors and requests slower than settings.access_log_slow_ms are always logged
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        settings = get_settings()
+        self.json_mode = settings.access_log_mode == "json"
+        self.sample_rate = settings.access_log_sample_rate
+        self.slow_seconds = settings.access_log_slow_ms / 1000
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Generate request ID for tracing
-        request_id = str(uuid.uuid4())[:8]
+        request_id = new_request_id()
 
         # Add request ID to request state
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Make request ID visible to the logger
+        # Make request ID visible to the logger, contextualize binds it once to every record logged within the request
         request_id_var.set(request_id)
+        with logger.contextualize(request_id=request_id):
+            await self.handle(scope, receive, send, request_id)
 
+    async def handle(self, scope: Scope, receive: Receive, send: Send, request_id: str):
+        """Log the request and pass it to the app."""
         start_time = time.time()
 
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        method = scope["method"]
+        path = scope["path"]
 
-        # Log request with more details
-        logger.info(
-            f"Method[{request.method}] URL[{request.url.path}] | "
-            f"Client[{client_ip}] | User-Agent[{request.headers.get('user-agent', 'unknown')}]",
-            request_id=request_id,
-        )
+        if not self.json_mode:
+            # Log request with more details
+            logger.info(f"Method[{method}] URL[{path}] | " f"Client[{client_ip(scope)}] | User-Agent[{user_agent(scope)}]")
 
-        try:
-            response: _StreamingResponse = await call_next(request)
+        # Body chunks are only referenced, not copied, so they can be logged if the app fails
+        body_chunks: list[bytes] = []
+        status_code = 500
 
-            # Log response
-            process_time = time.time() - start_time
-            logger.info(
-                f"Method[{request.method}] URL[{request.url.path}] | " f"Status[{response.status_code}] | Process Time[{process_time:.3f}s]",
-                request_id=request_id,
-            )
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                body_chunks.append(message.get("body", b""))
+            return message
 
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
 
-            return response
+                if not self.json_mode:
+                    # Log response
+                    process_time = time.time() - start_time
+                    logger.log(
+                        "WARNING" if process_time > self.slow_seconds else "INFO",
+                        f"Method[{method}] URL[{path}] | " f"Status[{status_code}] | Process Time[{process_time:.3f}s]",
+                    )
+
+                # Add request ID to response headers
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
 
         except Exception as e:
             process_time = time.time() - start_time
 
             try:
-                json_body = await request.json()
+                json_body = json.loads(b"".join(body_chunks))
             except Exception:
                 json_body = ""
 
-            logger.error(
-                f"Method[{request.method}] URL[{request.url.path}] | " f"Error Message[{str(e)}] | Process Time[{process_time:.3f}s]",
-                request_body=json_body,
-                request_query_params=request.query_params,
-                request_path_params=request.path_params,
-            )
+            query_params = scope["query_string"].decode("latin-1")
+            path_params = scope.get("path_params", {})
+
+            if self.json_mode:
+                self.access_log(
+                    scope,
+                    request_id,
+                    500,
+                    process_time,
+                    error=str(e),
+                    request_body=json_body,
+                    query_params=query_params,
+                    path_params=path_params,
+                )
+            else:
+                logger.error(
+                    f"Method[{method}] URL[{path}] | " f"Error Message[{str(e)}] | Process Time[{process_time:.3f}s]",
+                    request_body=json_body,
+                    request_query_params=query_params,
+                    request_path_params=path_params,
+                )
             raise e
+
+        if self.json_mode:
+            process_time = time.time() - start_time
+            # Sampled out requests cost one random() call, the record is built only when it is logged
+            if status_code >= 400 or process_time > self.slow_seconds or random.random() < self.sample_rate:
+                self.access_log(scope, request_id, status_code, process_time)
+
+    def access_log(self, scope: Scope, request_id: str, status_code: int, process_time: float, **extra):
+        """Emit single JSON access log record of a request."""
+        slow = process_time > self.slow_seconds
+        record = {
+            "request_id": request_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round(process_time * 1000, 3),
+            "slow": slow,
+            "client": client_ip(scope),
+            "user_agent": user_agent(scope),
+            **extra,
+        }
+        level = "ERROR" if status_code >= 500 else "WARNING" if status_code >= 400 or slow else "INFO"
+
+        # No keyword arguments, those would make loguru str.format() the JSON message
+        logger.log(level, json.dumps(record, default=str))
+
+
+def client_ip(scope: Scope) -> str:
+    """Client IP of the request, "unknown" when the server doesn't provide it."""
+    client = scope.get("client")
+
+    return client[0] if client else "unknown"
+
+
+def user_agent(scope: Scope) -> str:
+    """User-Agent header of the request, "unknown" when missing."""
+    return next((value.decode("latin-1") for key, value in scope["headers"] if key == b"user-agent"), "unknown")
@@ -0,0 +1,167 @@
+"""
+Production entry point, serves the app from several uvicorn worker processes sharing one listening socket.
+
+Workers are spawned, not forked. Each imports the app and creates its own engine and connection pool in the lifespan, see
+app.core.database.init_engine(), nothing is shared between processes. Pool settings are per worker, Postgres sees up to
+workers * (db_pool_size + db_max_overflow) connections. Caches (results, token roles, rollup state) are per worker as well.
+
+Signals of the supervisor process:
+    * SIGTERM / SIGINT  - graceful drain, workers stop accepting connections, finish in-flight requests (at most
+                          server_graceful_timeout seconds), dispose their engine and exit
+    * SIGHUP            - rolling reload, workers are replaced one at a time and the old worker is only terminated once its
+                          replacement completed the lifespan startup and listens, so capacity never drops. A replacement
+                          which doesn't get ready within server_ready_timeout seconds is killed and the reload stops.
+                          New workers load current code and .env settings
+    * SIGTTIN / SIGTTOU - one worker more / less
+
+Workers which die or stop answering the supervisor's health check are replaced.
+uvloop and httptools are used when installed (uv pip install uvloop httptools), asyncio and h11 otherwise.
+
+Run from the project root:
+    uv run python -m app.server --workers 4
+"""
+
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import time
+from socket import socket
+
+import uvicorn
+from uvicorn.supervisors.multiprocess import Multiprocess, Process
+
+from app.core.config import settings
+from app.core.logger import configure_uvicorn_logging, logger, setup_logger
+
+
+class ReadyServer(uvicorn.Server):
+    """uvicorn server which sets its ready event once the lifespan startup completed and it listens on the sockets."""
+
+    ready = None  # multiprocessing Event, set by Worker in the worker process
+
+    async def startup(self, sockets: list[socket] | None = None):
+        await super().startup(sockets)
+        if self.started and self.ready is not None:
+            self.ready.set()
+
+
+class Worker(Process):
+    """
+    Worker process serving a ReadyServer, ready is set once the app serves requests.
+
+    uvicorn's own health check (is_alive) is answered by a thread started before the app is even imported, so it can't tell
+    a worker which is about to crash in its lifespan from a healthy one.
+    """
+
+    def __init__(self, config: uvicorn.Config, server: ReadyServer, sockets: list[socket]):
+        self.server = server
+        self.ready = multiprocessing.get_context("spawn").Event()
+        super().__init__(config, server.run, sockets)
+
+    def target(self, sockets: list[socket] | None = None):
+        self.server.ready = self.ready
+        return super().target(sockets)
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Wait until the worker is ready, False when it exited or didn't get ready within timeout seconds."""
+        deadline = time.monotonic() + timeout
+        while not self.ready.wait(0.1):
+            if not self.process.is_alive() or time.monotonic() > deadline:
+                return False
+
+        return True
+
+
+class RollingMultiprocess(Multiprocess):
+    """
+    uvicorn's worker supervisor with a rolling SIGHUP reload.
+
+    uvicorn terminates a worker and waits for it to drain before starting its replacement, so every reload runs with one
+    worker less for up to server_graceful_timeout per worker. Here the replacement is started first and the old worker is
+    only terminated once the replacement is ready, a replacement that crashes or hangs in its startup stops the reload.
+    """
+
+    def __init__(self, config: uvicorn.Config, server: ReadyServer, sockets: list[socket], ready_timeout: float):
+        super().__init__(config, target=server.run, sockets=sockets)
+        self.server = server
+        self.ready_timeout = ready_timeout
+
+    def restart_all(self):
+        for idx, process in enumerate(self.processes):
+            replacement = Worker(self.config, self.server, self.sockets)
+            replacement.start()
+            if not replacement.wait_ready(self.ready_timeout):
+                logger.error(f"Replacement of worker [{process.pid}] didn't get ready, reload stopped, remaining workers are kept")
+                replacement.kill()
+                replacement.join()
+                return
+
+            self.processes[idx] = replacement
+            process.terminate()
+            process.join()
+
+
+def worker_count(workers: int) -> int:
+    """Number of worker processes, 0 = one per CPU core available to this process (cpuset/affinity aware)."""
+    if workers > 0:
+        return workers
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def run(app: str, host: str, port: int, workers: int, factory: bool = False):
+    """
+    Serve the app with a supervisor process and worker processes, returns after all workers exited.
+
+    Args:
+        app (str): Import string of the ASGI app, the app factory with factory.
+        host (str): Interface to bind to.
+        port (int): Port to bind to.
+        workers (int): Number of worker processes, 0 = one per CPU core.
+        factory (bool, optional): Whether app is a factory returning the app. Defaults to False.
+    """
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        factory=factory,
+        workers=worker_count(workers),
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keep_alive_timeout,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        log_config=None,  # Workers log through Loguru, configured in the lifespan
+    )
+
+    # Supervisor only logs worker starts, exits and signals, it never imports the app
+    setup_logger()
+    configure_uvicorn_logging()
+
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(f"Serving {app} on {host}:{port} with {config.workers} workers, event loop {loop}, HTTP parser {http}")
+
+    server = ReadyServer(config)
+    sock = config.bind_socket()
+    try:
+        RollingMultiprocess(config, server, [sock], settings.server_ready_timeout).run()
+    finally:
+        sock.close()
+        logger.remove()  # Flushes and closes the enqueued sinks of the supervisor
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", default="app.main:app", help="Import string of the ASGI app")
+    parser.add_argument("--factory", action="store_true", help="--app is a factory returning the app")
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument("--workers", type=int, default=settings.server_workers, help="Worker processes, 0 = one per CPU core")
+    args = parser.parse_args()
+
+    run(args.app, args.host, args.port, args.workers, args.factory)
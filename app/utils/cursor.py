@@ -0,0 +1,44 @@
+"""Utility functions for opaque keyset pagination cursors."""
+
+import base64
+import json
+
+
+def encode_cursor(*values: str) -> str:
+    """
+    Encode the sort key of the last returned row into an opaque, URL safe cursor.
+
+    Args:
+        *values (str): Values of the sort key columns, in the order the query sorts by.
+
+    Returns:
+        str: Cursor the client sends back to fetch the next page.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple[str, ...]:
+    """
+    Decode a cursor created by encode_cursor().
+
+    Args:
+        cursor (str): Cursor received from the client.
+        size (int): Expected number of sort key values.
+
+    Raises:
+        ValueError: Cursor is malformed or doesn't match the expected sort key.
+
+    Returns:
+        tuple[str, ...]: Values of the sort key columns.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:  # binascii.Error, UnicodeDecodeError and JSONDecodeError are all ValueErrors
+        raise ValueError(f"Malformed cursor: {cursor}") from e
+
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(value, str) for value in values):
+        raise ValueError(f"Malformed cursor: {cursor}")
+
+    return tuple(values)
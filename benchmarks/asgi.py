@@ -0,0 +1,63 @@
+"""Minimal in-process ASGI client, drives an app without sockets or extra dependencies."""
+
+import json
+from typing import Any
+
+from starlette.types import ASGIApp, Message
+
+
+async def request(app: ASGIApp, method: str, path: str, body: Any = None) -> tuple[int, bytes]:
+    """
+    Send one HTTP request straight to the ASGI app.
+
+    Args:
+        app (ASGIApp): Application to call.
+        method (str): HTTP method.
+        path (str): Path with optional query string.
+        body (Any, optional): JSON serializable request body. Defaults to None.
+
+    Returns:
+        tuple[int, bytes]: Response status and body.
+    """
+    path, _, query_string = path.partition("?")
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [(b"host", b"benchmark"), (b"user-agent", b"benchmark")]
+    if payload:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+        "state": {},
+    }
+    status = 0
+    chunks: list[bytes] = []
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message: Message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+
+    return status, b"".join(chunks)
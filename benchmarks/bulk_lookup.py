@@ -0,0 +1,65 @@
+"""
+Benchmark of the post_vms vm_name filter, expanding IN vs. single array parameter (= ANY).
+
+For each list size, the statement is compiled for asyncpg the way it is executed (IN expanded into one bind parameter per
+name) and the compile time and number of bind parameters are reported. The distinct SQL strings over random list lengths
+are the prepared statements asyncpg has to create, one per length with IN.
+
+Run from the project root:
+    uv run python -m benchmarks.bulk_lookup --sizes 10 1000 50000
+"""
+
+import argparse
+import os
+import random
+import time
+
+# Services read settings on import, the database itself is never contacted
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "benchmark")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect  # noqa: E402
+
+from app.domains.infrastructure import models, services  # noqa: E402
+
+DIALECT = asyncpg_dialect()
+
+
+def statement(names: list[str], array: bool):
+    column = models.InfrastructureVMs.vm_name
+    condition = services.in_values(column, names, "postgresql") if array else column.in_(names)
+
+    return select(*services.VM_COLUMNS).where(condition)
+
+
+def compile_sql(names: list[str], array: bool) -> tuple[str, int]:
+    compiled = statement(names, array).compile(dialect=DIALECT, compile_kwargs={"render_postcompile": True})
+
+    return str(compiled), len(compiled.params)
+
+
+def main(sizes: list[int], lengths: int):
+    print(f"{'size':>8} {'mode':<6} {'compile ms':>11} {'bind params':>12}")
+    for size in sizes:
+        names = [f"vm_{i}" for i in range(size)]
+        for mode, array in (("in", False), ("array", True)):
+            start = time.perf_counter()
+            _, params = compile_sql(names, array)
+            print(f"{size:>8} {mode:<6} {(time.perf_counter() - start) * 1000:>11.2f} {params:>12}")
+
+    rng = random.Random(0)
+    samples = [[f"vm_{i}" for i in range(rng.randint(1, 1000))] for _ in range(lengths)]
+    for mode, array in (("in", False), ("array", True)):
+        statements = {compile_sql(names, array)[0] for names in samples}
+        print(f"{mode:<6} {len(statements)} distinct statements over {lengths} random list lengths")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 50_000])
+    parser.add_argument("--lengths", type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.sizes, args.lengths)
@@ -0,0 +1,71 @@
+"""Minimal HTTP/1.1 keep-alive client over asyncio streams, drives a real server without extra dependencies."""
+
+import asyncio
+import json
+from typing import Any
+
+
+class Connection:
+    """One keep-alive connection, requests on it are sent one after another."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, body: Any = None) -> tuple[int, bytes]:
+        """
+        Send one HTTP request, (re)connecting when needed.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path with optional query string.
+            body (Any, optional): JSON serializable request body. Defaults to None.
+
+        Returns:
+            tuple[int, bytes]: Response status and body.
+        """
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        payload = json.dumps(body).encode() if body is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nUser-Agent: benchmark\r\n"
+        if payload:
+            head += f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+        self.writer.write(head.encode() + b"\r\n" + payload)
+
+        try:
+            return await self.read_response()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.close()
+            raise
+
+    async def read_response(self) -> tuple[int, bytes]:
+        status = int((await self.reader.readline()).split(b" ", 2)[1])
+
+        headers = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding") == "chunked":
+            chunks = []
+            while size := int((await self.reader.readline()).split(b";")[0], 16):
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            await self.reader.readline()
+            body = b"".join(chunks)
+        else:
+            body = await self.reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection") == "close":
+            await self.close()
+
+        return status, body
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            self.reader = None
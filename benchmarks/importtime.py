@@ -0,0 +1,87 @@
+"""
+Benchmark of cold import time of the app, from `python -X importtime`.
+
+Every module is imported in a fresh interpreter, repeat times, and its cumulative import time (own code plus everything it
+imports) is reported as best and median of the runs. The slowest modules by self time are listed for the last module.
+
+Importing must not load the DB driver (asyncpg) or create an engine, both belong to the lifespan of each worker, see
+app/core/database.py init_engine(). Exits with 1 when a module in LAZY_MODULES was loaded or when the best time of the
+last module is above --max-ms, so cold-start regressions fail a CI step.
+
+Run from the project root:
+    uv run python -m benchmarks.importtime --repeat 10 --max-ms 1500
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = ("app.core.config", "app.core.database", "app.main")
+
+# Loaded by init_engine() in the app lifespan, never by an import
+LAZY_MODULES = ("asyncpg", "sqlalchemy.dialects.postgresql.asyncpg")
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import module in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: Self and cumulative import time in microseconds by module name, of every module loaded.
+    """
+    env = dict(os.environ)
+    # Settings are read on import of the app, the database itself is never contacted
+    for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+        env.setdefault(var, "benchmark")
+    env.setdefault("POSTGRES_PORT", "5432")
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return times
+
+
+def main(modules: list[str], repeat: int, top: int, max_ms: float | None) -> int:
+    import_times(modules[-1])  # Warm-up, writes bytecode caches so no run includes compiling
+
+    failed = False
+    print(f"best and median of {repeat} fresh interpreters")
+    print(f"{'module':<24} {'best ms':>9} {'median ms':>10} {'modules':>8}  lazy")
+    for module in modules:
+        runs = [import_times(module) for _ in range(repeat)]
+        cumulative = [times[module][1] / 1000 for times in runs]
+        loaded = [name for name in LAZY_MODULES if name in runs[-1]]
+        failed |= bool(loaded)
+        print(f"{module:<24} {min(cumulative):>9.1f} {statistics.median(cumulative):>10.1f} {len(runs[-1]):>8}  {', '.join(loaded) or 'ok'}")
+
+    print(f"\nslowest modules imported by {module} (self ms)")
+    for name, (self_us, _) in sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[:top]:
+        print(f"{self_us / 1000:>9.1f}  {name}")
+
+    if max_ms is not None and min(cumulative) > max_ms:
+        print(f"\n{module} imports in {min(cumulative):.1f} ms, above --max-ms {max_ms}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=list(DEFAULT_MODULES), help="Modules to import, --max-ms applies to the last one")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    sys.exit(main(args.modules, args.repeat, args.top, args.max_ms))
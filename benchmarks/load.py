@@ -0,0 +1,426 @@
+"""
+Load benchmark of the infrastructure endpoints against a seeded v_infra_vms, see benchmarks.seed.
+
+Scenarios:
+    * all - GET /infrastructure/all, whole dataset per request
+    * vms - POST /infrastructure/vms, --vms-per-request random VMs of a random week
+
+Modes:
+    * inprocess - requests go straight to the ASGI app through benchmarks.asgi, logs are formatted and dropped
+    * uvicorn   - app served by `uvicorn --workers N`, requests over keep-alive connections through benchmarks.http_client
+
+Reports p50/p95/p99 latency, throughput and peak RSS (this process in-process, uvicorn workers otherwise) and writes them as
+JSON into benchmarks/results. With --baseline the run is compared to an earlier result file, exit code is 1 when p95 latency
+grew or throughput dropped by more than --tolerance.
+
+App settings are read from env as usual, e.g. CACHE_MAX_ENTRIES=0 measures the queries instead of cache hits.
+In-process runs also report connection pool wait and hold times per scenario. --session request holds the connection of read
+endpoints until the response is sent (transaction committed in dependency teardown), --session read (default) releases
+it right after each query, compare the hold times of both.
+The sqlite backend needs aiosqlite (uv pip install aiosqlite).
+
+Run from the project root:
+    uv run python -m benchmarks.seed --backend sqlite --rows 10000 --replace
+    uv run python -m benchmarks.load --backend sqlite --rows 10000 --mode inprocess
+    uv run python -m benchmarks.load --backend sqlite --rows 10000 --mode uvicorn --workers 4 --baseline benchmarks/results/<file>.json
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+# Settings are read on import, only used for a connection when --backend postgres
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "benchmark")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+
+from fastapi import FastAPI  # noqa: E402
+from loguru import logger  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from benchmarks import asgi, seed  # noqa: E402
+from benchmarks.http_client import Connection  # noqa: E402
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SQLITE_PATH_ENV = "BENCHMARK_SQLITE_PATH"
+SESSION_ENV = "BENCHMARK_SESSION"
+
+Send = Callable[[str, str, Any], Awaitable[tuple[int, bytes]]]
+
+
+# ============================================
+# APP
+# ============================================
+
+
+def override_session(app: FastAPI, sqlite_path: str) -> AsyncEngine:
+    """
+    Serve the app's DB sessions from the SQLite stand-in instead of Postgres.
+
+    Returns:
+        AsyncEngine: Engine of the stand-in, to dispose when done.
+    """
+    from app.core.database import (
+        MeteredQueuePool,
+        ReadSession,
+        get_read_session,
+        get_read_session_factory,
+        get_session,
+        get_session_factory,
+    )
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{sqlite_path}", poolclass=MeteredQueuePool)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession)
+    read_session_factory = async_sessionmaker(
+        bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=ReadSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    async def get_sqlite_session():
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def get_sqlite_read_session():
+        async with read_session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_sqlite_session
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    app.dependency_overrides[get_read_session] = get_sqlite_read_session
+    app.dependency_overrides[get_read_session_factory] = lambda: read_session_factory
+
+    return engine
+
+
+def hold_read_sessions(app: FastAPI):
+    """Serve read endpoints from get_session (or its override), the connection is held until the response is sent."""
+    from app.core.database import (
+        get_read_session,
+        get_read_session_factory,
+        get_session,
+        get_session_factory,
+    )
+
+    app.dependency_overrides[get_read_session] = app.dependency_overrides.get(get_session, get_session)
+    app.dependency_overrides[get_read_session_factory] = app.dependency_overrides.get(get_session_factory, get_session_factory)
+
+
+def create_app() -> FastAPI:
+    """App factory of the uvicorn workers, serves the SQLite stand-in when BENCHMARK_SQLITE_PATH is set."""
+    from app.main import app
+
+    sqlite_path = os.environ.get(SQLITE_PATH_ENV)
+    if sqlite_path:
+        override_session(app, sqlite_path)
+    if os.environ.get(SESSION_ENV) == "request":
+        hold_read_sessions(app)
+
+    return app
+
+
+# ============================================
+# LOAD
+# ============================================
+
+
+def scenario_request(scenario: str, rows: int, vms_per_request: int, rng: random.Random) -> Callable[[], tuple[str, str, Any]]:
+    """Return function producing (method, path, body) of the next request of the scenario."""
+    if scenario == "all":
+        return lambda: ("GET", "/infrastructure/all", None)
+
+    vms, weeks = seed.dataset_shape(rows)
+
+    def vms_request():
+        body = {
+            "vm_name": [seed.vm_name(rng.randint(1, vms)) for _ in range(vms_per_request)],
+            "fisc_wk": seed.fisc_wk(rng.randint(1, weeks)),
+        }
+        return "POST", "/infrastructure/vms", body
+
+    return vms_request
+
+
+async def drive(senders: list[Send], next_request: Callable[[], tuple[str, str, Any]], requests: int) -> dict:
+    """
+    Send requests with one concurrent worker per sender.
+
+    Returns:
+        dict: Latency percentiles, throughput and errors (non 200 responses and failed requests).
+    """
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(send: Send):
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            method, path, body = next_request()
+            start = time.perf_counter()
+            try:
+                status, _ = await send(method, path, body)
+            except Exception:
+                status = 0
+            latencies.append(time.perf_counter() - start)
+            errors += status != 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(send) for send in senders])
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentiles[49] * 1000, 3),
+            "p95": round(percentiles[94] * 1000, 3),
+            "p99": round(percentiles[98] * 1000, 3),
+            "max": round(max(latencies) * 1000, 3),
+        },
+    }
+
+
+async def run_scenarios(senders: list[Send], args: argparse.Namespace, pool_metrics: Any = None) -> dict:
+    """Run all scenarios, with pool_metrics (in-process) the pool wait and hold times of each scenario are added."""
+    rng = random.Random(args.seed)
+    results = {}
+    for scenario in args.scenarios:
+        next_request = scenario_request(scenario, args.rows, args.vms_per_request, rng)
+        requests = args.all_requests if scenario == "all" else args.requests
+
+        await drive(senders[:1], next_request, args.warmup)
+        if pool_metrics is not None:
+            pool_metrics.reset()
+        results[scenario] = await drive(senders, next_request, requests)
+        if pool_metrics is not None:
+            results[scenario]["pool"] = pool_metrics.snapshot()
+        print_scenario(scenario, results[scenario])
+
+    return results
+
+
+# ============================================
+# MODES
+# ============================================
+
+
+async def run_inprocess(args: argparse.Namespace) -> tuple[dict, dict]:
+    from app.core import database
+    from app.core.logger import LOG_FORMAT, correlation_filter
+    from app.main import app
+
+    logger.remove()
+    logger.add(lambda message: None, format=LOG_FORMAT, filter=correlation_filter)
+
+    engine = override_session(app, args.sqlite_path) if args.backend == "sqlite" else database.init_engine()  # Lifespan is not run
+    if args.session == "request":
+        hold_read_sessions(app)
+    try:
+        scenarios = await run_scenarios([partial(asgi.request, app)] * args.concurrency, args, database.pool_metrics)
+    finally:
+        await engine.dispose()
+
+    peak_rss_mb = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+    return scenarios, {"peak_rss_mb": peak_rss_mb, "peak_rss_total_mb": peak_rss_mb}
+
+
+async def run_uvicorn(args: argparse.Namespace) -> tuple[dict, dict]:
+    env = dict(os.environ)
+    env[SESSION_ENV] = args.session
+    if args.backend == "sqlite":
+        env[SQLITE_PATH_ENV] = str(Path(args.sqlite_path).resolve())
+
+    command = [sys.executable, "-m", "uvicorn", "benchmarks.load:create_app", "--factory"]
+    command += ["--host", "127.0.0.1", "--port", str(args.port), "--workers", str(args.workers)]
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+
+    connections = [Connection("127.0.0.1", args.port) for _ in range(args.concurrency)]
+    try:
+        await wait_ready(connections[0], server)
+        scenarios = await run_scenarios([connection.request for connection in connections], args)
+        rss = [peak_rss_mb(pid) for pid in worker_pids(server.pid)]
+    finally:
+        for connection in connections:
+            await connection.close()
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    return scenarios, {"peak_rss_mb": max(rss), "peak_rss_total_mb": round(sum(rss), 1)}
+
+
+async def wait_ready(connection: Connection, server: subprocess.Popen, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"uvicorn exited with code {server.returncode}")
+        try:
+            status, _ = await connection.request("GET", "/openapi.json")
+            if status == 200:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.2)
+
+    raise SystemExit(f"uvicorn not ready after {timeout}s")
+
+
+def worker_pids(pid: int) -> list[int]:
+    """Worker processes of uvicorn, the server process itself when it runs without a supervisor (--workers 1)."""
+    children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+
+    return [int(child) for child in children] or [pid]
+
+
+def peak_rss_mb(pid: int) -> float:
+    """Peak resident set size of a process (VmHWM), Linux only."""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return round(int(line.split()[1]) / 1024, 1)
+
+    return 0.0
+
+
+# ============================================
+# RESULTS
+# ============================================
+
+
+def print_scenario(name: str, result: dict):
+    latency = result["latency_ms"]
+    print(
+        f"{name:<5} {result['throughput_rps']:>10,.1f} req/s | p50 {latency['p50']:>8.2f}ms | p95 {latency['p95']:>8.2f}ms | "
+        f"p99 {latency['p99']:>8.2f}ms | errors {result['errors']}"
+    )
+    if "pool" in result:
+        pool = result["pool"]
+        print(
+            f"      pool hold avg {pool['hold_time_avg_ms']:>8.2f}ms | hold max {pool['hold_time_max_ms']:>8.2f}ms | "
+            f"wait avg {pool['wait_time_avg_ms']:>8.2f}ms | timeouts {pool['timeouts']}"
+        )
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> bool:
+    """
+    Print changes against the baseline run.
+
+    Returns:
+        bool: True when p95 latency or throughput of any scenario regressed by more than tolerance.
+    """
+    for key in ("backend", "rows", "mode", "workers", "concurrency", "session"):
+        if result[key] != baseline.get(key):
+            print(f"Warning: {key} differs from baseline ({result[key]} vs. {baseline.get(key)})")
+
+    regressed = False
+    for name, current in result["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+
+        p95_change = current["latency_ms"]["p95"] / previous["latency_ms"]["p95"] - 1
+        throughput_change = current["throughput_rps"] / previous["throughput_rps"] - 1
+        scenario_regressed = p95_change > tolerance or throughput_change < -tolerance
+        regressed |= scenario_regressed
+        print(f"{name:<5} p95 {p95_change:+.1%} | throughput {throughput_change:+.1%}{' | REGRESSION' if scenario_regressed else ''}")
+
+    return regressed
+
+
+def main(args: argparse.Namespace) -> int:
+    if args.backend == "sqlite" and importlib.util.find_spec("aiosqlite") is None:
+        raise SystemExit("--backend sqlite needs aiosqlite (uv pip install aiosqlite)")
+
+    from app.core.config import settings
+
+    print(f"{args.backend}, {args.rows:,} rows, {args.mode}, concurrency {args.concurrency}")
+    run = run_inprocess if args.mode == "inprocess" else run_uvicorn
+    scenarios, rss = asyncio.run(run(args))
+    print(f"peak RSS {rss['peak_rss_mb']} MB, total {rss['peak_rss_total_mb']} MB")
+
+    result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "app_version": settings.app_version,
+        "python": platform.python_version(),
+        "backend": args.backend,
+        "rows": args.rows,
+        "mode": args.mode,
+        "workers": args.workers if args.mode == "uvicorn" else None,
+        "concurrency": args.concurrency,
+        "session": args.session,
+        "vms_per_request": args.vms_per_request,
+        "scenarios": scenarios,
+        **rss,
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{args.backend}-{args.rows}-{args.mode}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        return int(compare(result, json.loads(Path(args.baseline).read_text()), args.tolerance))
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("postgres", "sqlite"), default="postgres")
+    parser.add_argument("--sqlite-path", default="benchmarks/results/v_infra_vms.db")
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows the dataset was seeded with")
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--workers", type=int, default=2, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--scenarios", type=lambda value: value.split(","), default=["all", "vms"])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests of the vms scenario")
+    parser.add_argument("--all-requests", type=int, default=50, help="Requests of the all scenario, each returns whole dataset")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--vms-per-request", type=int, default=10)
+    parser.add_argument("--session", choices=("read", "request"), default="read", help="Session of read endpoints, see above")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random request bodies")
+    parser.add_argument("--output", help="Result file, defaults to benchmarks/results/<time>-<backend>-<rows>-<mode>.json")
+    parser.add_argument("--baseline", help="Earlier result file to compare to")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed relative regression of p95 latency and throughput")
+    args = parser.parse_args()
+
+    sys.exit(main(args))
@@ -0,0 +1,140 @@
+"""
+Microbenchmark of log records/sec through the loguru configuration of app.core.logger.
+
+Compares:
+    * previous correlation filter (uuid4() per record when no request ID is set) with the current one (request ID bound
+      once through logger.contextualize, constant ID outside of requests), and per request ID generation
+    * stdlib records (e.g. uvicorn) bridged by the previous InterceptHandler (root logger at level 0, level lookup and
+      stack walk per record) with the current one, with and without caller info, and DEBUG records below log level
+
+Records go to two sinks with the app's format which drop the output, so only the caller side cost is measured.
+
+Run from the project root:
+    uv run python -m benchmarks.logger --records 200000
+"""
+
+import argparse
+import logging
+import os
+import time
+import uuid
+
+# Logger reads settings on import, the database itself is never contacted
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "benchmark")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+
+from loguru import logger  # noqa: E402
+
+from app.core.logger import (  # noqa: E402
+    LOG_FORMAT,
+    LOG_FORMAT_NO_CALLER,
+    InterceptHandler,
+    correlation_filter,
+    new_request_id,
+    request_id_var,
+)
+
+
+def previous_correlation_filter(record) -> bool:
+    """Previous filter, kept here as the baseline."""
+    record["extra"]["request_id"] = request_id_var.get() or str(uuid.uuid4())[:8]
+    return True
+
+
+class PreviousInterceptHandler(logging.Handler):
+    """Previous InterceptHandler, kept here as the baseline."""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        frame = logging.currentframe()
+        depth = 2
+        while frame and frame.f_code.co_filename == logging.__file__:
+            frame = frame.f_back
+            depth += 1
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+
+def configure(filter_fn, log_format: str = LOG_FORMAT, level: str = "DEBUG"):
+    logger.remove()
+    for _ in range(2):  # Console and file sink
+        logger.add(lambda message: None, format=log_format, level=level, filter=filter_fn)
+
+
+def configure_stdlib(handler: logging.Handler, level: int) -> logging.Logger:
+    logging.basicConfig(handlers=[handler], level=level, force=True)
+    stdlib_logger = logging.getLogger("uvicorn.access")
+    stdlib_logger.handlers = [handler]
+    stdlib_logger.propagate = False
+    stdlib_logger.setLevel(level)
+
+    return stdlib_logger
+
+
+def rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    fn(count)
+
+    return count / (time.perf_counter() - start)
+
+
+def log_records(count: int):
+    for _ in range(count):
+        logger.info("benchmark record")
+
+
+def main(records: int):
+    print(f"{records} records, 2 sinks")
+
+    configure(previous_correlation_filter)
+    print(f"{'previous filter, outside request':<36} {rate(log_records, records):>10,.0f} records/s")
+    token = request_id_var.set("abcd1234")
+    print(f"{'previous filter, inside request':<36} {rate(log_records, records):>10,.0f} records/s")
+    request_id_var.reset(token)
+
+    configure(correlation_filter)
+    print(f"{'current filter, outside request':<36} {rate(log_records, records):>10,.0f} records/s")
+    with logger.contextualize(request_id=new_request_id()):
+        print(f"{'current filter, inside request':<36} {rate(log_records, records):>10,.0f} records/s")
+
+    def uuid_ids(count: int):
+        for _ in range(count):
+            str(uuid.uuid4())[:8]
+
+    def counter_ids(count: int):
+        for _ in range(count):
+            new_request_id()
+
+    print(f"{'request IDs, uuid4()[:8]':<36} {rate(uuid_ids, records):>10,.0f} IDs/s")
+    print(f"{'request IDs, new_request_id()':<36} {rate(counter_ids, records):>10,.0f} IDs/s")
+
+    def stdlib_records(stdlib_logger: logging.Logger, level: int):
+        def log(count: int):
+            for _ in range(count):
+                stdlib_logger.log(level, '127.0.0.1:50000 - "GET /infrastructure/all HTTP/1.1" 200')
+
+        return log
+
+    configure(correlation_filter, level="INFO")
+    stdlib_logger = configure_stdlib(PreviousInterceptHandler(), 0)
+    print(f"{'previous intercept, INFO':<36} {rate(stdlib_records(stdlib_logger, logging.INFO), records):>10,.0f} records/s")
+    print(f"{'previous intercept, DEBUG dropped':<36} {rate(stdlib_records(stdlib_logger, logging.DEBUG), records):>10,.0f} records/s")
+
+    stdlib_logger = configure_stdlib(InterceptHandler(), logging.INFO)
+    print(f"{'current intercept, INFO':<36} {rate(stdlib_records(stdlib_logger, logging.INFO), records):>10,.0f} records/s")
+    print(f"{'current intercept, DEBUG dropped':<36} {rate(stdlib_records(stdlib_logger, logging.DEBUG), records):>10,.0f} records/s")
+
+    configure(correlation_filter, log_format=LOG_FORMAT_NO_CALLER, level="INFO")
+    stdlib_logger = configure_stdlib(InterceptHandler(caller_info=False), logging.INFO)
+    print(f"{'current intercept, INFO, no caller':<36} {rate(stdlib_records(stdlib_logger, logging.INFO), records):>10,.0f} records/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    main(args.records)
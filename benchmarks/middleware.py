@@ -0,0 +1,102 @@
+"""
+Benchmark of LoggingMiddleware overhead.
+
+Compares requests/sec of a trivial endpoint with:
+    * none          - no middleware
+    * basehttp      - previous BaseHTTPMiddleware based LoggingMiddleware
+    * asgi          - current pure ASGI LoggingMiddleware
+
+Requests are sent in-process through benchmarks.asgi, logs go to a sink which drops them, so only the middleware cost is measured.
+
+Run from the project root:
+    uv run python -m benchmarks.middleware --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from typing import Callable
+
+# Middleware imports settings through app.core.logger, the database itself is never contacted
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "benchmark")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from loguru import logger  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware, _StreamingResponse  # noqa: E402
+
+from app.core.logger import request_id_var  # noqa: E402
+from app.middleware.logging import LoggingMiddleware  # noqa: E402
+from benchmarks import asgi  # noqa: E402
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """Previous LoggingMiddleware implementation, kept here as the baseline."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = str(uuid.uuid4())[:8]
+        request.state.request_id = request_id
+        request_id_var.set(request_id)
+        start_time = time.time()
+        client_ip = request.client.host if request.client else "unknown"
+        logger.info(
+            f"Method[{request.method}] URL[{request.url.path}] | "
+            f"Client[{client_ip}] | User-Agent[{request.headers.get('user-agent', 'unknown')}]",
+            request_id=request_id,
+        )
+        response: _StreamingResponse = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(
+            f"Method[{request.method}] URL[{request.url.path}] | " f"Status[{response.status_code}] | Process Time[{process_time:.3f}s]",
+            request_id=request_id,
+        )
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+def build_app(middleware: type | None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"status": "ok"}
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> float:
+    async def worker(count: int):
+        for _ in range(count):
+            status, _ = await asgi.request(app, "GET", "/ping")
+            assert status == 200
+
+    await worker(100)  # Warm up, builds the middleware stack
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(requests // concurrency) for _ in range(concurrency)])
+
+    return (requests // concurrency * concurrency) / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int):
+    logger.remove()
+    logger.add(lambda message: None, format="{message}")
+
+    print(f"{requests} requests, concurrency {concurrency}")
+    for name, middleware in (("none", None), ("basehttp", BaseHTTPLoggingMiddleware), ("asgi", LoggingMiddleware)):
+        print(f"{name:<10} {await run(build_app(middleware), requests, concurrency):>10,.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
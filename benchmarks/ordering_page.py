@@ -0,0 +1,115 @@
+"""
+Benchmark of paging through the orders of one status, OFFSET vs. keyset pages with total_count.
+
+Modes:
+    * offset       - ORDER BY order_number OFFSET skip LIMIT limit per page plus a separate count(*) (old endpoints)
+    * keyset_count - /ordering/page query, order_number > cursor with count of all matches as scalar subquery in the same query
+    * keyset       - /ordering/page query with count=none, only the page is read
+
+Orders live in an SQLite file with the recommended (order_status, order_number) index, see docs/info.txt. Numbers show how
+page cost grows with depth, not network or Postgres time.
+
+Run from the project root:
+    uv run python -m benchmarks.ordering_page --rows 500000 --limit 100
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+# Services read settings on import, the database itself is never contacted
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "benchmark")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+
+from sqlalchemy import Engine, create_engine, func, insert, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.domains.ordering import services  # noqa: E402
+
+ORDERS = services.ORDERS
+STATUSES = ("Cancelled", "In Production", "Invoiced", "Manifested", "Rejected", "Ship Complete")
+BATCH_SIZE = 50_000
+
+
+def seed(path: str, rows: int) -> Engine:
+    """Create orders table with the given number of rows and the recommended indexes."""
+    engine = create_engine(f"sqlite:///{path}")
+    ORDERS.create(engine)
+    rng = random.Random(rows)
+
+    with engine.begin() as conn:
+        for start in range(0, rows, BATCH_SIZE):
+            conn.execute(
+                insert(ORDERS),
+                [
+                    {"order_number": f"O{i:09d}", "srf_number": f"SRF{i // 20:07d}", "order_status": rng.choice(STATUSES)}
+                    for i in range(start, min(start + BATCH_SIZE, rows))
+                ],
+            )
+        conn.execute(text(f'CREATE INDEX ix_orders_status ON "{ORDERS.name}" (order_status, order_number)'))
+        conn.execute(text(f'CREATE INDEX ix_orders_srf ON "{ORDERS.name}" (srf_number, order_number)'))
+        conn.execute(text("ANALYZE"))
+
+    return engine
+
+
+def offset_pages(session: Session, status: str, limit: int) -> tuple[list[float], int]:
+    conditions = [ORDERS.c.order_status == status]
+    times = []
+    start = time.perf_counter()
+    session.execute(select(func.count()).select_from(ORDERS).where(*conditions)).scalar()
+    queries = 1
+    skip = 0
+    while True:
+        page_start = time.perf_counter()
+        stmt = select(ORDERS).where(*conditions).order_by(ORDERS.c.order_number).offset(skip).limit(limit)
+        rows = session.execute(stmt).all()
+        times.append(time.perf_counter() - (start if skip == 0 else page_start))  # First page includes the count
+        queries += 1
+        if len(rows) < limit:
+            return times, queries
+        skip += limit
+
+
+def keyset_pages(session: Session, status: str, limit: int, with_count: bool) -> tuple[list[float], int]:
+    conditions = [ORDERS.c.order_status == status, ORDERS.c.order_number.is_not(None)]
+    times = []
+    after = None
+    while True:
+        page_start = time.perf_counter()
+        rows = session.execute(services.page_stmt(conditions, limit, after, with_count)).all()
+        times.append(time.perf_counter() - page_start)
+        if len(rows) <= limit:
+            return times, len(times)
+        after = rows[limit - 1].order_number
+
+
+def main(rows: int, limit: int):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = seed(str(Path(directory) / "orders.db"), rows)
+        status = STATUSES[0]
+
+        print(f"{rows} rows, status {status!r}, page size {limit}")
+        print(f"{'mode':<13} {'pages':>6} {'queries':>8} {'total s':>9} {'first ms':>9} {'last ms':>9}")
+        for mode in ("offset", "keyset_count", "keyset"):
+            with Session(engine) as session:
+                if mode == "offset":
+                    times, queries = offset_pages(session, status, limit)
+                else:
+                    times, queries = keyset_pages(session, status, limit, with_count=mode == "keyset_count")
+            print(f"{mode:<13} {len(times):>6} {queries:>8} {sum(times):>9.3f} {times[0] * 1000:>9.2f} {times[-1] * 1000:>9.2f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.rows, args.limit)
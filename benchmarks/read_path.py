@@ -0,0 +1,93 @@
+"""
+Benchmark of the VM read path, ORM entities vs. Core select on the table.
+
+Compares rows/sec and memory held per row of:
+    * orm     - select(InfrastructureVMs) ORM objects in a default session, identity map and commit (original path)
+    * columns - select() of the mapped attributes, rows through the ORM compile and loading steps, then commit
+    * core    - select(*VM_COLUMNS) on InfrastructureVMs.__table__ in a no-autoflush session without commit (current path)
+
+Rows live in an in-memory SQLite table, so numbers only show the Python side of the read, not network or Postgres time.
+Memory per row is measured with tracemalloc in a separate run, while the fetched rows are still referenced.
+
+Run from the project root:
+    uv run python -m benchmarks.read_path --rows 100000
+"""
+
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from typing import Callable
+
+# Services read settings on import, the database itself is never contacted
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "benchmark")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+
+from sqlalchemy import Engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.domains.infrastructure import models, services  # noqa: E402
+from benchmarks.serialization import seed  # noqa: E402
+
+VMS = models.InfrastructureVMs
+
+
+def orm_path(engine: Engine) -> list:
+    with Session(engine) as session:
+        rows = session.execute(select(VMS)).scalars().all()
+        session.commit()
+    return rows
+
+
+def columns_path(engine: Engine) -> list:
+    with Session(engine) as session:
+        rows = session.execute(select(VMS.vm_name, VMS.fisc_wk, VMS.fisc_yr, VMS.cost, VMS.role)).all()
+        session.commit()
+    return rows
+
+
+def core_path(engine: Engine) -> list:
+    with Session(engine, autoflush=False, expire_on_commit=False) as session:
+        return session.execute(select(*services.VM_COLUMNS)).all()
+
+
+def measure_time(path: Callable[[Engine], list], engine: Engine, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path(engine)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_memory(path: Callable[[Engine], list], engine: Engine) -> int:
+    """Bytes allocated and still referenced by the fetched rows."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rows = path(engine)  # noqa: F841, rows must stay referenced while measuring
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held
+
+
+def main(rows: int, repeat: int):
+    engine = seed(rows)
+
+    print(f"{rows} rows, best of {repeat}")
+    print(f"{'path':<8} {'fetch s':>9} {'rows/s':>12} {'bytes/row':>10}")
+    for name, path in (("orm", orm_path), ("columns", columns_path), ("core", core_path)):
+        fetch = measure_time(path, engine, repeat)
+        held = measure_memory(path, engine)
+        print(f"{name:<8} {fetch:>9.3f} {rows / fetch:>12,.0f} {held / rows:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.rows, args.repeat)
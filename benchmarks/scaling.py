@@ -0,0 +1,134 @@
+"""
+Throughput scaling of the production launcher (app/server.py) with the number of worker processes.
+
+For every worker count the app is started with `python -m app.server --workers N` and a scenario of benchmarks.load is
+driven by --clients load generator processes, each with --concurrency keep-alive connections. One load generator process
+saturates about one core, so it can't keep several workers busy on its own.
+
+Prints req/s, speedup over the first worker count and efficiency (speedup per added worker, 100% = linear scaling).
+Workers and load generators share the machine, scaling flattens once both together need more cores than there are.
+The sqlite backend serves the stand-in seeded by benchmarks.seed and needs aiosqlite (uv pip install aiosqlite).
+
+Run from the project root:
+    uv run python -m benchmarks.seed --backend sqlite --rows 10000 --replace
+    uv run python -m benchmarks.scaling --backend sqlite --rows 10000 --workers 1 2 4 8 --clients 4
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import signal
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from benchmarks import load
+from benchmarks.http_client import Connection
+
+
+def default_workers() -> list[int]:
+    """1, 2, 4, ... up to the CPU cores of the machine."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+
+    return counts
+
+
+def client(port: int, args: argparse.Namespace, seed: int) -> dict:
+    """Load generator process, drives the scenario over args.concurrency keep-alive connections."""
+
+    async def drive() -> dict:
+        connections = [Connection("127.0.0.1", port) for _ in range(args.concurrency)]
+        senders = [connection.request for connection in connections]
+        next_request = load.scenario_request(args.scenario, args.rows, args.vms_per_request, random.Random(seed))
+        try:
+            await load.drive(senders, next_request, args.warmup)
+            return await load.drive(senders, next_request, args.requests)
+        finally:
+            for connection in connections:
+                await connection.close()
+
+    return asyncio.run(drive())
+
+
+def measure(workers: int, args: argparse.Namespace, env: dict) -> dict:
+    """
+    Serve the app with the given number of workers and run all load generators at once.
+
+    Returns:
+        dict: Summed throughput, worst p95 latency of the load generators and errors.
+    """
+    command = [sys.executable, "-m", "app.server", "--app", "benchmarks.load:create_app", "--factory"]
+    command += ["--host", "127.0.0.1", "--port", str(args.port), "--workers", str(workers)]
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL)
+
+    try:
+        asyncio.run(wait_ready(server, args.port))
+        seeds = range(args.seed, args.seed + args.clients)
+        with ProcessPoolExecutor(max_workers=args.clients) as executor:
+            results = list(executor.map(client, [args.port] * args.clients, [args] * args.clients, seeds))
+    finally:
+        server.send_signal(signal.SIGTERM)  # Graceful drain, same as a production shutdown
+        try:
+            server.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    return {
+        "throughput_rps": round(sum(result["throughput_rps"] for result in results), 1),
+        "p95_ms": max(result["latency_ms"]["p95"] for result in results),
+        "errors": sum(result["errors"] for result in results),
+    }
+
+
+async def wait_ready(server: subprocess.Popen, port: int):
+    connection = Connection("127.0.0.1", port)
+    try:
+        await load.wait_ready(connection, server)
+    finally:
+        await connection.close()
+
+
+def main(args: argparse.Namespace):
+    env = dict(os.environ)
+    env[load.SESSION_ENV] = "read"
+    if args.backend == "sqlite":
+        env[load.SQLITE_PATH_ENV] = str(Path(args.sqlite_path).resolve())
+
+    print(f"{args.backend}, {args.rows:,} rows, scenario {args.scenario}, {args.clients} load generators x {args.concurrency} connections")
+    print(f"{'workers':>7} {'req/s':>10} {'p95 ms':>9} {'speedup':>8} {'efficiency':>11} {'errors':>7}")
+    first = None
+    for workers in args.workers:
+        result = measure(workers, args, env)
+        first = first or (workers, result["throughput_rps"])
+        speedup = result["throughput_rps"] / first[1]
+        efficiency = speedup / (workers / first[0])
+        print(f"{workers:>7} {result['throughput_rps']:>10,.1f} {result['p95_ms']:>9.2f} {speedup:>7.2f}x {efficiency:>10.0%} {result['errors']:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("postgres", "sqlite"), default="postgres")
+    parser.add_argument("--sqlite-path", default="benchmarks/results/v_infra_vms.db")
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows the dataset was seeded with")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers(), help="Worker counts, defaults to 1, 2, 4, ... cores")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--scenario", choices=("all", "vms"), default="vms")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per load generator")
+    parser.add_argument("--warmup", type=int, default=50, help="Requests per load generator before measuring")
+    parser.add_argument("--clients", type=int, default=2, help="Load generator processes")
+    parser.add_argument("--concurrency", type=int, default=16, help="Connections per load generator")
+    parser.add_argument("--vms-per-request", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random request bodies")
+    args = parser.parse_args()
+
+    if args.backend == "sqlite" and not Path(args.sqlite_path).exists():
+        raise SystemExit(f"{args.sqlite_path} doesn't exist, seed it first with benchmarks.seed --backend sqlite")
+
+    main(args)
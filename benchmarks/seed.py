@@ -0,0 +1,178 @@
+"""
+Seed a synthetic v_infra_vms dataset for the load benchmark.
+
+Scales the docs/help_queries.sql seed: tables vms and clusters joined by the v_infra_vms view, 52 fiscal weeks of FY26 per
+VM, VMs spread over the clusters (and their roles) of the seed. Data is deterministic, so runs on the same size are comparable.
+
+Backends:
+    * postgres - database from POSTGRES_* env variables (same as the app), rows are loaded with COPY
+    * sqlite   - SQLite file stand-in with the same tables and view, served through aiosqlite by benchmarks.load
+
+Existing tables are only replaced with --replace.
+
+Run from the project root:
+    uv run python -m benchmarks.seed --backend postgres --rows 1000000 --replace
+    uv run python -m benchmarks.seed --backend sqlite --sqlite-path bench.db --rows 10000 --replace
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterator
+
+WEEKS = 52
+FISC_YR = "FY26"
+CLUSTERS = ((1, "cluster_1", "SQL"), (2, "cluster_2", "Windows"), (3, "cluster_3", "Kaffka"))
+BATCH_SIZE = 100_000
+
+DROP = (
+    "DROP VIEW IF EXISTS v_infra_vms",
+    "DROP TABLE IF EXISTS vms",
+    "DROP TABLE IF EXISTS clusters",
+    # Rollups of the previous data would be reported as fresh, see app/domains/infrastructure/rollups.py
+    "DROP TABLE IF EXISTS infra_cost_wk_role",
+    "DROP TABLE IF EXISTS infra_cost_yr_vm",
+    "DROP TABLE IF EXISTS infra_rollup_state",
+)
+
+CREATE = (
+    "CREATE TABLE clusters (cluster_id INTEGER PRIMARY KEY, cluster_name TEXT, role TEXT)",
+    "CREATE TABLE vms (vm_name TEXT, fisc_wk TEXT, fisc_yr TEXT, cluster_id INTEGER, cost DOUBLE PRECISION, PRIMARY KEY (vm_name, fisc_wk))",
+    "CREATE INDEX ix_vms_fisc_wk ON vms (fisc_wk)",  # Fiscal week lookups and incremental rollup refreshes
+)
+
+CREATE_VIEW = (
+    "CREATE VIEW v_infra_vms AS "
+    "SELECT vms.vm_name, vms.fisc_wk, vms.fisc_yr, vms.cost, clusters.role "
+    "FROM vms LEFT JOIN clusters ON clusters.cluster_id = vms.cluster_id"
+)
+
+
+def dataset_shape(rows: int) -> tuple[int, int]:
+    """
+    Number of VMs and weeks per VM of a dataset with the given number of rows.
+
+    Returns:
+        tuple[int, int]: VMs, weeks. Last VM may have less weeks so the total matches rows.
+    """
+    return math.ceil(rows / WEEKS), WEEKS
+
+
+def vm_name(index: int) -> str:
+    return f"vm_{index}"
+
+
+def fisc_wk(week: int) -> str:
+    return f"2026-W{week:02d}"
+
+
+def generate_rows(rows: int) -> Iterator[tuple[str, str, str, int, float]]:
+    """Yield (vm_name, fisc_wk, fisc_yr, cluster_id, cost) rows of vms table."""
+    rng = random.Random(rows)
+    vms, weeks = dataset_shape(rows)
+    produced = 0
+    for vm in range(1, vms + 1):
+        cluster_id = CLUSTERS[vm % len(CLUSTERS)][0]
+        base_cost = rng.choice((1000, 2000, 8000, 17000))
+        for week in range(1, weeks + 1):
+            if produced == rows:
+                return
+            yield vm_name(vm), fisc_wk(week), FISC_YR, cluster_id, base_cost * rng.uniform(0.9, 1.1)
+            produced += 1
+
+
+def batches(rows: int) -> Iterator[list[tuple]]:
+    batch = []
+    for row in generate_rows(rows):
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ============================================
+# BACKENDS
+# ============================================
+
+
+async def seed_postgres(rows: int, replace: bool):
+    import asyncpg
+
+    from app.core.config import settings
+
+    conn = await asyncpg.connect(
+        host=settings.postgres_host,
+        port=settings.postgres_port,
+        user=settings.postgres_user,
+        password=settings.postgres_password,
+        database=settings.postgres_db,
+    )
+    try:
+        async with conn.transaction():
+            if replace:
+                for statement in DROP:
+                    await conn.execute(statement)
+            for statement in CREATE:
+                await conn.execute(statement)
+            await conn.executemany("INSERT INTO clusters VALUES ($1, $2, $3)", CLUSTERS)
+            for batch in batches(rows):
+                await conn.copy_records_to_table("vms", records=batch, columns=["vm_name", "fisc_wk", "fisc_yr", "cluster_id", "cost"])
+            await conn.execute(CREATE_VIEW)
+        await conn.execute("ANALYZE vms")
+        await conn.execute("ANALYZE clusters")
+    finally:
+        await conn.close()
+
+
+def seed_sqlite(path: str, rows: int, replace: bool):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            if replace:
+                for statement in DROP:
+                    conn.execute(statement)
+            for statement in CREATE:
+                conn.execute(statement)
+            conn.executemany("INSERT INTO clusters VALUES (?, ?, ?)", CLUSTERS)
+            for batch in batches(rows):
+                conn.executemany("INSERT INTO vms VALUES (?, ?, ?, ?, ?)", batch)
+            conn.execute(CREATE_VIEW)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+
+def seed(backend: str, rows: int, replace: bool = False, sqlite_path: str | None = None):
+    """
+    Create and fill vms, clusters and the v_infra_vms view.
+
+    Args:
+        backend (str): "postgres" or "sqlite".
+        rows (int): Rows of v_infra_vms.
+        replace (bool, optional): Drop existing tables, including the rollups, first. Defaults to False.
+        sqlite_path (str | None, optional): Database file of the sqlite backend.
+    """
+    if backend == "postgres":
+        asyncio.run(seed_postgres(rows, replace))
+    else:
+        seed_sqlite(sqlite_path, rows, replace)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("postgres", "sqlite"), default="postgres")
+    parser.add_argument("--sqlite-path", default="benchmarks/results/v_infra_vms.db")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--replace", action="store_true", help="Drop existing vms, clusters, v_infra_vms and rollups first")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    seed(args.backend, args.rows, args.replace, args.sqlite_path)
+    print(f"Seeded {args.rows:,} rows ({args.backend}) in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,103 @@
+"""
+Benchmark of the post_vms response path.
+
+Compares rows/sec of:
+    * orm   - select(InfrastructureVMs) ORM objects, model_validate per row, then response_model validation and serialization (old path)
+    * rows  - select(*VM_COLUMNS) tuples rendered once to JSON bytes by services.render_vms_out() (current path)
+
+Rows live in an in-memory SQLite table, so fetch numbers only show the ORM hydration overhead, not network or Postgres time.
+
+Run from the project root:
+    uv run python -m benchmarks.serialization --rows 100000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+# Services read settings on import, the database itself is never contacted
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "benchmark")
+os.environ.setdefault("POSTGRES_PORT", "5432")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.domains.infrastructure import models, schemas, services  # noqa: E402
+
+RESPONSE_FIELD = create_model_field(name="Response_post_vms", type_=schemas.InfrastructureVMsOut, mode="serialization")
+
+
+def seed(rows: int):
+    """Create in-memory v_infra_vms with the given number of rows."""
+    engine = create_engine("sqlite://")
+    table = models.InfrastructureVMs.__table__
+    table.create(engine)
+
+    weeks = 52
+    with engine.begin() as conn:
+        conn.execute(
+            insert(table),
+            [
+                {
+                    "vm_name": f"vm_{i // weeks}",
+                    "fisc_wk": f"2026-W{i % weeks + 1:02d}",
+                    "fisc_yr": "FY26",
+                    "cost": float(1000 * (i % 17 + 1)),
+                    "role": ("SQL", "Windows", "Kaffka")[i % 3],
+                }
+                for i in range(rows)
+            ],
+        )
+
+    return engine
+
+
+async def orm_path(session: Session) -> tuple[float, float]:
+    start = time.perf_counter()
+    result_scalars = session.execute(select(models.InfrastructureVMs)).scalars().all()
+    fetched = time.perf_counter()
+
+    result_pydantic = schemas.InfrastructureVMsOut(
+        total_count=len(result_scalars),
+        data=[schemas.InfrastructureVMsAll.model_validate(vm) for vm in result_scalars],
+    )
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=result_pydantic, is_coroutine=True)
+    JSONResponse(content).body
+    session.expunge_all()
+
+    return fetched - start, time.perf_counter() - fetched
+
+
+async def rows_path(session: Session) -> tuple[float, float]:
+    start = time.perf_counter()
+    rows = session.execute(select(*services.VM_COLUMNS)).all()
+    fetched = time.perf_counter()
+
+    services.render_vms_out(rows)
+
+    return fetched - start, time.perf_counter() - fetched
+
+
+async def main(rows: int, repeat: int):
+    engine = seed(rows)
+
+    print(f"{rows} rows, best of {repeat}")
+    print(f"{'path':<6} {'fetch s':>9} {'serialize s':>12} {'total rows/s':>14}")
+    for name, path in (("orm", orm_path), ("rows", rows_path)):
+        with Session(engine) as session:
+            fetch, serialize = min([await path(session) for _ in range(repeat)], key=sum)
+        print(f"{name:<6} {fetch:>9.3f} {serialize:>12.3f} {rows / (fetch + serialize):>14,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.repeat))
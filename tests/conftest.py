@@ -0,0 +1,6 @@
+import os
+
+# Settings are read on import of the routers, the database itself is never contacted by the tests
+for var in ("POSTGRES_HOST", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_DB_SCHEMA"):
+    os.environ.setdefault(var, "test")
+os.environ.setdefault("POSTGRES_PORT", "5432")
@@ -0,0 +1,128 @@
+import asyncio
+
+from app.core.cache import TTLCache
+
+
+def loader(value, calls: list):
+    async def load():
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value
+
+    return load
+
+
+def test_hit_after_miss():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def main():
+        return [await cache.get_or_load("k", loader("v", calls)) for _ in range(3)]
+
+    assert asyncio.run(main()) == ["v"] * 3
+    assert calls == ["v"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_concurrent_misses_share_one_load():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def main():
+        return await asyncio.gather(*[cache.get_or_load("k", loader("v", calls)) for _ in range(5)])
+
+    assert asyncio.run(main()) == ["v"] * 5
+    assert calls == ["v"]
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_expired_entry_is_loaded_again():
+    cache = TTLCache(max_entries=10, ttl_seconds=0.01)
+    calls = []
+
+    async def main():
+        await cache.get_or_load("k", loader("v", calls))
+        await asyncio.sleep(0.02)
+        await cache.get_or_load("k", loader("v", calls))
+
+    asyncio.run(main())
+
+    assert calls == ["v", "v"]
+
+
+def test_ttl_of_caps_and_skips_entries():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def main():
+        await cache.get_or_load("expired", loader(-1, calls), ttl_of=lambda value: value)
+        await cache.get_or_load("expired", loader(-1, calls), ttl_of=lambda value: value)
+        await cache.get_or_load("valid", loader(30, calls), ttl_of=lambda value: value)
+        await cache.get_or_load("valid", loader(30, calls), ttl_of=lambda value: value)
+
+    asyncio.run(main())
+
+    assert calls == [-1, -1, 30]  # Values with ttl <= 0 are never stored
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    calls = []
+
+    async def main():
+        await cache.get_or_load("a", loader("a", calls))
+        await cache.get_or_load("b", loader("b", calls))
+        await cache.get_or_load("a", loader("a", calls))  # a is now the most recently used
+        await cache.get_or_load("c", loader("c", calls))
+        await cache.get_or_load("a", loader("a", calls))
+        await cache.get_or_load("b", loader("b", calls))
+
+    asyncio.run(main())
+
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.evictions == 2
+
+
+def test_invalidate_tag_drops_tagged_entries():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def main():
+        await cache.get_or_load("a", loader("a", calls), tags=("2026-W01",))
+        await cache.get_or_load("b", loader("b", calls), tags=("2026-W01", "2026-W02"))
+        await cache.get_or_load("c", loader("c", calls), tags=("2026-W02",))
+        dropped = cache.invalidate_tag("2026-W01")
+        for key in ("a", "b", "c"):
+            await cache.get_or_load(key, loader(key, calls))
+        return dropped
+
+    assert asyncio.run(main()) == 2
+    assert calls == ["a", "b", "c", "a", "b"]
+
+
+def test_load_in_flight_during_invalidation_is_not_stored():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = []
+
+    async def main():
+        load = asyncio.create_task(cache.get_or_load("k", loader("old", calls), tags=("2026-W01",)))
+        await asyncio.sleep(0)
+        cache.invalidate_tag("2026-W01")
+        await load
+        return await cache.get_or_load("k", loader("new", calls))
+
+    assert asyncio.run(main()) == "new"
+
+
+def test_zero_max_entries_disables_storing():
+    cache = TTLCache(max_entries=0, ttl_seconds=60)
+    calls = []
+
+    async def main():
+        await cache.get_or_load("k", loader("v", calls))
+        await cache.get_or_load("k", loader("v", calls))
+
+    asyncio.run(main())
+
+    assert calls == ["v", "v"]
+    assert cache.stats()["entries"] == 0
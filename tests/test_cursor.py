@@ -0,0 +1,32 @@
+import pytest
+
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_round_trip():
+    cursor = encode_cursor("vm_1", "2026-W01")
+
+    assert decode_cursor(cursor, 2) == ("vm_1", "2026-W01")
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor("vm/ü?&=", "x" * 7)
+
+    assert "=" not in cursor
+    assert all(char.isalnum() or char in "-_" for char in cursor)
+    assert decode_cursor(cursor, 2) == ("vm/ü?&=", "x" * 7)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        "%%%",
+        encode_cursor("vm_1"),  # Wrong number of values
+        "eyJhIjoxfQ",  # {"a":1}, not a list
+        "WzEsMl0",  # [1,2], not strings
+    ],
+)
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
@@ -0,0 +1,27 @@
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.api.api import api_router
+
+app = FastAPI()
+app.include_router(api_router)
+
+ORDERING_ROUTES = [route for route in api_router.routes if isinstance(route, APIRoute) and route.path.startswith("/ordering")]
+
+
+def test_ordering_is_mounted():
+    assert ORDERING_ROUTES
+
+
+@pytest.mark.parametrize("route", ORDERING_ROUTES, ids=lambda route: route.path)
+def test_ordering_routes_require_a_token(route: APIRoute):
+    path = re.sub(r"\{[^}]+\}", "1", route.path)
+
+    with TestClient(app) as client:
+        response = client.request(next(iter(route.methods)), path)
+
+    assert response.status_code == 401
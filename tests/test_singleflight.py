@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    executions = 0
+
+    async def fn():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return executions
+
+    async def main():
+        return await asyncio.gather(*[flight.do("k", fn) for _ in range(5)])
+
+    assert asyncio.run(main()) == [1] * 5
+    assert flight.stats() == {"calls": 1, "coalesced": 4, "inflight": 0}
+
+
+def test_sequential_calls_execute_again():
+    flight = SingleFlight()
+
+    async def fn():
+        return "value"
+
+    async def main():
+        return [await flight.do("k", fn), await flight.do("k", fn)]
+
+    assert asyncio.run(main()) == ["value", "value"]
+    assert flight.calls == 2
+
+
+def test_exception_is_shared_with_waiters():
+    flight = SingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(*[flight.do("k", fn) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.stats() == {"calls": 1, "coalesced": 2, "inflight": 0}
+
+
+def test_cancelled_leader_is_taken_over_by_one_waiter():
+    flight = SingleFlight()
+    executions = 0
+
+    async def fn():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.05)
+        return executions
+
+    async def main():
+        leader = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flight.do("k", fn)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        return await asyncio.gather(*waiters, return_exceptions=True), leader
+
+    results, leader = asyncio.run(main())
+
+    assert leader.cancelled()
+    assert results == [2, 2, 2]  # Second execution, shared by all waiters
+    # Waiter which took over counts as a call only, the other two received its result
+    assert flight.stats() == {"calls": 2, "coalesced": 2, "inflight": 0}
+
+
+def test_cancelled_waiter_doesnt_cancel_the_call():
+    flight = SingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("k", fn))
+        await asyncio.sleep(0.005)
+        waiter.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await leader
+
+    assert asyncio.run(main()) == "value"
+    assert flight.stats()["inflight"] == 0